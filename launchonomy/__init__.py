@@ -7,11 +7,27 @@ A comprehensive system for orchestrating AI agents to build and grow autonomous
 __version__ = "1.0.0"
 __author__ = "Launchonomy Team"
 
-from .core.orchestrator import OrchestrationAgent, create_orchestrator
-from .cli import main as cli_main
+# Top-level exports are resolved on first access so lightweight entry points
+# (e.g. ``python -m launchonomy.cli_workspace --help``) do not import the
+# orchestrator stack and Rich up front.
+_LAZY_EXPORTS = {
+    "OrchestrationAgent": (".core.orchestrator", "OrchestrationAgent"),
+    "create_orchestrator": (".core.orchestrator", "create_orchestrator"),
+    "cli_main": (".cli", "main"),
+}
 
 __all__ = [
     "OrchestrationAgent",
     "create_orchestrator", 
     "cli_main"
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        module_name, attr = _LAZY_EXPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
@@ -6,6 +6,9 @@ import asyncio
 import logging
 import os
 import glob
+import time
+from collections import deque
+from itertools import islice
 
 # Add project root to Python path for proper orchestrator package imports
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -13,9 +16,9 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 from dotenv import load_dotenv
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 import click
-from rich.console import Console
+from rich.console import Console, Group
 from rich.logging import RichHandler
 from rich.prompt import Prompt, Confirm
 from rich.live import Live
@@ -29,8 +32,47 @@ from rich.table import Table
 from .core.orchestrator import create_orchestrator
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from .utils.logging import OverallMissionLog, get_timestamp
-from .utils.cost_calculator import calculate_cycle_cost
-import re
+from .utils.cost_calculator import calculate_cycle_costs
+from .utils.optional_imports import safe_json_dumps, safe_json_loads
+
+# Prefer Google RE2 (linear-time DFA matching) when installed; every pattern below is RE2-compatible
+try:
+    import re2 as re
+except ImportError:
+    import re
+
+# Patterns used to detect tool usage in agent log messages (matched against lowercased text)
+TOOL_USAGE_PATTERNS = [
+    re.compile(r'using tool[:\s]+(\w+)'),
+    re.compile(r'calling tool[:\s]+(\w+)'),
+    re.compile(r'executing tool[:\s]+(\w+)'),
+    re.compile(r'tool[:\s]+(\w+)[:\s]+(?:called|executed|used)'),
+    re.compile(r'(?:spreadsheet|calendar|email|crm|analytics|payment|webhook|api|database)'),
+]
+
+# Orchestrator progress messages, checked in order: trigger substring -> (overall status, activity detail)
+ORCHESTRATOR_STATUS_MESSAGES = {
+    "Determining next strategic step": ("Orchestrator: Planning next strategy...", "Analyzing previous cycles and determining next strategic step"),
+    "Revising rejected cycle": ("Orchestrator: Revising plan after feedback...", "Processing user feedback and revising approach"),
+    "Selecting or creating specialist": ("Orchestrator: Delegating to specialist...", "Finding or creating appropriate specialist agent"),
+    "Starting decision loop with": ("Orchestrator: Consulting {}...", "Running decision loop with {} for recommendations"),
+    "Assigning execution task to": ("Orchestrator: Tasking {}...", "Delegating execution task to {}"),
+    "Attempting to execute recommendation via": ("Orchestrator: {} executing...", "{} is executing the recommended action"),
+    "Performing final smoke-test review": ("Orchestrator: Reviewing outcome...", "Conducting final review of execution results"),
+    "Archiving cycle log and running retrospective": ("Orchestrator: Finalizing cycle...", "Archiving logs and running retrospective analysis"),
+}
+
+# Triggers above whose messages name an agent: trigger -> (capturing pattern, fallback name)
+ORCHESTRATOR_STATUS_AGENT_PATTERNS = {
+    "Starting decision loop with": (re.compile(r"Starting decision loop with (\w+)"), "specialist"),
+    "Assigning execution task to": (re.compile(r"Assigning execution task to (\w+)"), "agent"),
+    "Attempting to execute recommendation via": (re.compile(r"via (\w+)"), "agent"),
+}
+
+ASKING_AGENT_PATTERN = re.compile(r"Asking (\w+[-]?\w*)")
+
+# Number of continuous-loop execution log entries kept in memory; older entries live only on disk
+EXECUTION_LOG_WINDOW = 50
 
 # Note: load_dotenv() is called in main() to ensure it runs from user's working directory
 
@@ -154,6 +196,28 @@ class AgentLogger:
             
         self.console.print(f"[bold {color}]{agent_name}[/bold {color}]: {message}")
 
+class ElapsedTimer:
+    """Status line renderable that recomputes elapsed time and token totals on every Live refresh."""
+
+    def __init__(self, monitor: 'MissionMonitor'):
+        self.monitor = monitor
+
+    def __rich_console__(self, console, options):
+        monitor = self.monitor
+        timer_token_line = Text()
+        if monitor._current_operation_start_time and monitor._mission_is_running:
+            timer_token_line.append(f"Elapsed: {monitor.elapsed_seconds():.1f}s", style="dim")
+        else:
+            timer_token_line.append("Elapsed: --", style="dim")
+
+        # Add token usage
+        timer_token_line.append(" | ", style="dim")
+        timer_token_line.append(f"Tokens: ", style="dim")
+        timer_token_line.append(f"↑{monitor.total_input_tokens:,}", style="green")
+        timer_token_line.append(" ", style="dim")
+        timer_token_line.append(f"↓{monitor.total_output_tokens:,}", style="cyan")
+        yield timer_token_line
+
 class MissionMonitor:
     def __init__(self):
         self.layout = Layout()
@@ -163,16 +227,16 @@ class MissionMonitor:
             Layout(name="agents", size=7),
             Layout(name="logs", ratio=1)
         )
-        self.logs = []
+        self.logs = deque(maxlen=500)  # Bounded internal log, oldest entries drop off
         self._overall_status_message = "Initializing..."
         self._detail_activity_message = ""
         self._mission_is_running = True 
-        self._current_operation_start_time = datetime.now()
+        self._current_operation_start_time = time.monotonic()
         self.current_cycle_agents = set()
         self.all_known_agents = set()
         self.spinner = Spinner("dots", text=Text(self._overall_status_message, style="blue"))
         self.brief_activity_log_max_lines = 30 # For tall terminals - shows recent activity
-        self.brief_activity_log = [] # Separate list for UI panel
+        self.brief_activity_log = deque(maxlen=self.brief_activity_log_max_lines) # Separate ring for UI panel
         self.orchestrator = None  # Will be set to access registry
         
         # Token tracking
@@ -181,6 +245,9 @@ class MissionMonitor:
         
         # Tools in use tracking
         self.tools_in_use = set()
+        
+        # Timer line is re-rendered by Live's auto refresh, no polling task required
+        self.timer = ElapsedTimer(self)
 
     def set_overall_status(self, message: str, is_running: bool):
         self._overall_status_message = message
@@ -188,11 +255,15 @@ class MissionMonitor:
             self.spinner.update(text=Text(message, style="blue"))
         
         if is_running and not self._mission_is_running:
-            self._current_operation_start_time = datetime.now()
+            self._current_operation_start_time = time.monotonic()
         
         self._mission_is_running = is_running
         if is_running and self._current_operation_start_time is None:
-            self._current_operation_start_time = datetime.now()
+            self._current_operation_start_time = time.monotonic()
+
+    def elapsed_seconds(self) -> float:
+        """Seconds since the current operation started, measured on the monotonic clock."""
+        return time.monotonic() - self._current_operation_start_time
 
     def set_detail_activity(self, message: str):
         # Allow longer messages for 3-line display
@@ -216,28 +287,25 @@ class MissionMonitor:
         """Remove a tool from the active tools list."""
         self.tools_in_use.discard(tool_name)
         
-    def add_log(self, message: str, msg_type: str = "info"):
+    def add_log(self, agent: str, text: str, msg_type: str = "info"):
+        """Record a log entry; entries are kept as (agent, text) and only formatted at render time."""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        full_log_entry = f"[{timestamp}] {message}"
-        self.logs.append(full_log_entry) # Keep full internal log
-        if len(self.logs) > 200: # Prune internal log
-            self.logs = self.logs[-100:] 
+        self.logs.append((timestamp, agent, text)) # Keep recent internal log
 
-        # Update brief activity log for UI (excluding debug, truncating others)
+        # Update brief activity log for UI (excluding debug; truncation happens when rendered)
         if msg_type != "debug":
-            max_brief_len = 120  # Allow longer messages for better readability
-            brief_log_entry = message # Use message directly, not full_log_entry with timestamp
-            if len(brief_log_entry) > max_brief_len:
-                brief_log_entry = brief_log_entry[:max_brief_len-3] + "..."
-            
-            self.brief_activity_log.append(brief_log_entry) 
             # Always keep the most recent entries (scroll from bottom)
-            if len(self.brief_activity_log) > self.brief_activity_log_max_lines:
-                self.brief_activity_log = self.brief_activity_log[-self.brief_activity_log_max_lines:]
+            self.brief_activity_log.append((agent, text)) 
         
     def add_agent(self, agent: str):
         self.current_cycle_agents.add(agent)
         self.all_known_agents.add(agent)
+    
+    def add_agents(self, agents: Iterable[str]):
+        """Add several agents in one call."""
+        agents = set(agents)
+        self.current_cycle_agents.update(agents)
+        self.all_known_agents.update(agents)
         
     def remove_agent(self, agent: str):
         self.current_cycle_agents.discard(agent)
@@ -258,24 +326,15 @@ class MissionMonitor:
         if self._detail_activity_message:
             textual_parts_for_status_line.append(Text.assemble(Text(" [", style="dim"), Text(self._detail_activity_message, style="italic dim"), Text("]", style="dim")))
 
-        if self._current_operation_start_time and self._mission_is_running: 
-            elapsed_seconds = (datetime.now() - self._current_operation_start_time).total_seconds()
-            textual_parts_for_status_line.append(f" ({elapsed_seconds:.1f}s)")
-        
+        # Elapsed time is rendered live by ElapsedTimer, not frozen into this text
         assembled_main_text = Text.assemble(*textual_parts_for_status_line)
 
         panel_renderable: Union[Text, Columns]
         if self._mission_is_running:
             elements_for_columns = [self.spinner]
-            if self._detail_activity_message or (self._current_operation_start_time and self._mission_is_running):
+            if self._detail_activity_message:
                 elements_for_columns.append(Text(" "))
-                detail_and_timer_parts = []
-                if self._detail_activity_message:
-                    detail_and_timer_parts.append(Text.assemble(Text(" [", style="dim"), Text(self._detail_activity_message, style="italic dim"), Text("]", style="dim")))
-                if self._current_operation_start_time and self._mission_is_running:
-                    elapsed_seconds = (datetime.now() - self._current_operation_start_time).total_seconds()
-                    detail_and_timer_parts.append(Text(f" ({elapsed_seconds:.1f}s)", style="dim"))
-                elements_for_columns.append(Text.assemble(*detail_and_timer_parts))
+                elements_for_columns.append(Text.assemble(Text(" [", style="dim"), Text(self._detail_activity_message, style="italic dim"), Text("]", style="dim")))
 
             panel_renderable = Columns(elements_for_columns, padding=0, expand=False)
         else:
@@ -317,25 +376,8 @@ class MissionMonitor:
         else:
             status_lines.append(Text("Activity: Idle", style="dim"))
         
-        # Line: Timer and Token usage
-        timer_token_line = Text()
-        if self._current_operation_start_time and self._mission_is_running:
-            # Always calculate elapsed time fresh for real-time updates
-            elapsed_seconds = (datetime.now() - self._current_operation_start_time).total_seconds()
-            timer_token_line.append(f"Elapsed: {elapsed_seconds:.1f}s", style="dim")
-        else:
-            timer_token_line.append("Elapsed: --", style="dim")
-        
-        # Add token usage
-        timer_token_line.append(" | ", style="dim")
-        timer_token_line.append(f"Tokens: ", style="dim")
-        timer_token_line.append(f"↑{self.total_input_tokens:,}", style="green")
-        timer_token_line.append(" ", style="dim")
-        timer_token_line.append(f"↓{self.total_output_tokens:,}", style="cyan")
-        
-        status_lines.append(timer_token_line)
-        
-        status_content = Text("\n").join(status_lines)
+        # Line: Timer and Token usage - rendered lazily so every Live refresh shows fresh values
+        status_content = Group(Text("\n").join(status_lines), self.timer)
         
         self.layout["status"].update(
             Panel(status_content, title="Status")
@@ -387,23 +429,28 @@ class MissionMonitor:
             available_log_height = 15  # Fallback for smaller terminals
         
         # Show the most recent entries that fit in available space (auto-scroll to bottom)
-        visible_entries = self.brief_activity_log[-available_log_height:] if len(self.brief_activity_log) > available_log_height else self.brief_activity_log
+        visible_entries = list(self.brief_activity_log)[-available_log_height:]
         
-        for i, entry in enumerate(visible_entries):
+        max_brief_len = 120  # Allow longer messages for better readability
+        for i, (agent_name, message) in enumerate(visible_entries):
             if i > 0:
                 log_content.append("\n")
             
-            # Extract agent name and message for coloring
-            if ": " in entry:
-                agent_name, message = entry.split(": ", 1)
+            # Truncate the combined "agent: message" line to the panel budget
+            if agent_name:
+                message_budget = max_brief_len - len(agent_name) - 2
+                if len(message) > message_budget:
+                    message = message[:max(message_budget - 3, 0)] + "..."
                 
                 # Color all agent names in cyan (same as Known Agents panel)
                 log_content.append(agent_name, style="cyan")
                 log_content.append(": ", style="dim")
                 log_content.append(message)
             else:
-                # No agent name found, use plain text
-                log_content.append(entry)
+                # No agent name, use plain text
+                if len(message) > max_brief_len:
+                    message = message[:max_brief_len-3] + "..."
+                log_content.append(message)
         
         self.layout["logs"].update(
             Panel(
@@ -412,6 +459,51 @@ class MissionMonitor:
             )
         )
 
+def append_execution_log(spill_path: str, cycle_logs: Iterable[Dict[str, Any]]):
+    """Append continuous-loop execution log entries to a JSONL spill file."""
+    with open(spill_path, "a") as f:
+        for cycle_log in cycle_logs:
+            f.write(safe_json_dumps(cycle_log, default=str) + "\n")
+
+def iter_execution_log(spill_path: str, start_offset: int = 0) -> Iterator[Dict[str, Any]]:
+    """Stream execution log entries back from a JSONL spill file, starting at a byte offset."""
+    with open(spill_path, "r") as f:
+        f.seek(start_offset)
+        for line in f:
+            if line.strip():
+                yield safe_json_loads(line)
+
+def summarize_execution_log(cycle_logs: Iterable[Dict[str, Any]], batch_size: int = EXECUTION_LOG_WINDOW) -> Iterator[Dict[str, Any]]:
+    """Convert execution log entries to decision cycle summaries, costing them one batch at a time."""
+    now_iso = datetime.now().isoformat()  # Fallback timestamp for cycles that did not record one
+    cycle_logs = iter(cycle_logs)
+    while True:
+        batch = list(islice(cycle_logs, batch_size))
+        if not batch:
+            return
+        cycle_costs = calculate_cycle_costs(batch)  # One batched pass per chunk of cycles
+        for cycle_log, cycle_cost in zip(batch, cycle_costs):
+            yield {
+                "cycle_id": f"csuite_cycle_{cycle_log.get('iteration', 0)}",
+                "timestamp": cycle_log.get("timestamp", now_iso),
+                "decision_focus": f"C-Suite orchestrated iteration {cycle_log.get('iteration', 0)}",
+                "status": "success" if cycle_log.get("cycle_successful", False) else "failed",
+                "execution_output": {
+                    "execution_type": "csuite_orchestrated",
+                    "description": f"C-Suite planning + workflow execution: {', '.join(cycle_log.get('steps', {}).keys())}",
+                    "output_data": {
+                        "csuite_planning": cycle_log.get("csuite_planning", {}),
+                        "workflow_steps": cycle_log.get("steps", {}),
+                        "csuite_review": cycle_log.get("csuite_review", {}),
+                        "revenue_generated": cycle_log.get("revenue_generated", 0.0),
+                        "errors": cycle_log.get("errors", []),
+                        "guardrail_status": cycle_log.get("guardrail_status", "OK")
+                    }
+                },
+                "total_cycle_cost": cycle_cost,
+                "recommendation_text": f"C-Suite cycle {cycle_log.get('iteration', 0)} - Strategic planning + {len(cycle_log.get('steps', {}))} workflow agents"
+            }
+
 def load_mission_log(mission_file_path: str) -> Optional[OverallMissionLog]:
     """Load a mission log from workspace or old format file."""
     try:
@@ -714,17 +806,7 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
         # Suppress external loggers to prevent UI interference
         suppress_external_loggers()
         
-        with Live(monitor.layout, refresh_per_second=3, console=console, vertical_overflow="visible") as live:
-            
-            # Background task to update timer display
-            async def timer_update_task():
-                while live.is_started:
-                    if monitor._mission_is_running:
-                        monitor.update(overall_mission_string)
-                    await asyncio.sleep(0.33)  # Update every 1/3 second
-            
-            # Start the timer update task
-            timer_task = asyncio.create_task(timer_update_task())
+        with Live(monitor.layout, auto_refresh=True, refresh_per_second=3, console=console, vertical_overflow="visible") as live:
             
             # Define a wrapper for log_patch that has access to the live object
             def live_aware_log_patch(agent_name: str, msg: str, msg_type: str = "info"):
@@ -736,17 +818,11 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
                 # Token tracking is now handled by TokenTrackingOpenAIClient wrapper
                 
                 # Extract tool usage from log messages
-                tool_usage_patterns = [
-                    r'using tool[:\s]+(\w+)',
-                    r'calling tool[:\s]+(\w+)',
-                    r'executing tool[:\s]+(\w+)',
-                    r'tool[:\s]+(\w+)[:\s]+(?:called|executed|used)',
-                    r'(?:spreadsheet|calendar|email|crm|analytics|payment|webhook|api|database)',
-                ]
+                msg_lower = msg.lower()
                 
                 # Check for specific tool mentions
-                for pattern in tool_usage_patterns:
-                    tool_match = re.search(pattern, msg.lower())
+                for pattern in TOOL_USAGE_PATTERNS:
+                    tool_match = pattern.search(msg_lower)
                     if tool_match:
                         if tool_match.groups():
                             tool_name = tool_match.group(1)
@@ -756,34 +832,16 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
                         break
                 
                 # Check for tool completion/stopping
-                if any(phrase in msg.lower() for phrase in ['tool completed', 'tool finished', 'tool stopped']):
+                if any(phrase in msg_lower for phrase in ['tool completed', 'tool finished', 'tool stopped']):
                     # Could extract specific tool name and remove it, but for now just note completion
                     pass
                 
                 # The rest of log_patch logic for updating monitor panels remains the same
-                monitor.add_log(f"{agent_name}: {msg}", msg_type)
+                monitor.add_log(agent_name, msg, msg_type)
 
                 if agent_name not in monitor.current_cycle_agents:
                     monitor.add_agent(agent_name)
 
-                if agent_name == orchestrator.name: 
-                    creation_match = re.search(r"Creating new agent: '([^']*)'", msg)
-                    if creation_match:
-                        new_agent_name = creation_match.group(1)
-                        if new_agent_name not in monitor.all_known_agents:
-                            monitor.add_agent(new_agent_name)
-                            logger.debug(f"Detected and added new agent from log: {new_agent_name}")
-                    
-                    created_match = re.search(r"Agent '([^']*)' created successfully", msg)
-                    if created_match:
-                        new_agent_name = created_match.group(1)
-                        if new_agent_name not in monitor.all_known_agents:
-                            monitor.add_agent(new_agent_name)
-                            # Update mission log with new agent
-                            if new_agent_name not in overall_log.created_agents:
-                                overall_log.created_agents.append(new_agent_name)
-                            logger.debug(f"Detected and added confirmed agent from log: {new_agent_name}")
-                
                 new_overall_status = ""
                 activity_detail = ""
                 is_processing = True 
@@ -801,47 +859,29 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
                     activity_detail = "Waiting for user decision on cycle outcome"
                     is_processing = False
                 elif agent_name == orchestrator.name:
-                    if "Determining next strategic step" in msg:
-                        new_overall_status = "Orchestrator: Planning next strategy..."
-                        activity_detail = f"Analyzing previous cycles and determining next strategic step"
-                    elif "Revising rejected cycle" in msg:
-                        new_overall_status = "Orchestrator: Revising plan after feedback..."
-                        activity_detail = f"Processing user feedback and revising approach"
-                    elif "Selecting or creating specialist" in msg:
-                        new_overall_status = "Orchestrator: Delegating to specialist..."
-                        activity_detail = f"Finding or creating appropriate specialist agent"
-                    elif "Starting decision loop with" in msg:
-                        match = re.search(r"Starting decision loop with (\w+)", msg)
-                        specialist = match.group(1) if match else "specialist"
-                        new_overall_status = f"Orchestrator: Consulting {specialist}..."
-                        activity_detail = f"Running decision loop with {specialist} for recommendations"
-                    elif "Assigning execution task to" in msg:
-                        match = re.search(r"Assigning execution task to (\w+)", msg)
-                        executor = match.group(1) if match else "agent"
-                        new_overall_status = f"Orchestrator: Tasking {executor}..."
-                        activity_detail = f"Delegating execution task to {executor}"
-                    elif "Attempting to execute recommendation via" in msg:
-                        match = re.search(r"via (\w+)", msg)
-                        executor = match.group(1) if match else "agent"
-                        new_overall_status = f"Orchestrator: {executor} executing..."
-                        activity_detail = f"{executor} is executing the recommended action"
-                    elif "Performing final smoke-test review" in msg:
-                        new_overall_status = "Orchestrator: Reviewing outcome..."
-                        activity_detail = f"Conducting final review of execution results"
-                    elif "Archiving cycle log and running retrospective" in msg:
-                        new_overall_status = "Orchestrator: Finalizing cycle..."
-                        activity_detail = f"Archiving logs and running retrospective analysis"
-                    elif "Asking" in msg and "Agent" in msg:
-                        # Handle agent communication messages
-                        agent_match = re.search(r"Asking (\w+[-]?\w*)", msg)
-                        if agent_match:
-                            target_agent = agent_match.group(1)
-                            new_overall_status = f"Orchestrator: Consulting {target_agent}..."
-                            activity_detail = f"Requesting input from {target_agent}"
+                    for trigger, (status_template, detail_template) in ORCHESTRATOR_STATUS_MESSAGES.items():
+                        if trigger in msg:
+                            if trigger in ORCHESTRATOR_STATUS_AGENT_PATTERNS:
+                                pattern, fallback_name = ORCHESTRATOR_STATUS_AGENT_PATTERNS[trigger]
+                                match = pattern.search(msg)
+                                target = match.group(1) if match else fallback_name
+                                new_overall_status = status_template.format(target)
+                                activity_detail = detail_template.format(target)
+                            else:
+                                new_overall_status, activity_detail = status_template, detail_template
+                            break
+                    else:
+                        if "Asking" in msg and "Agent" in msg:
+                            # Handle agent communication messages
+                            agent_match = ASKING_AGENT_PATTERN.search(msg)
+                            if agent_match:
+                                target_agent = agent_match.group(1)
+                                new_overall_status = f"Orchestrator: Consulting {target_agent}..."
+                                activity_detail = f"Requesting input from {target_agent}"
+                            else:
+                                activity_detail = f"{agent_name}: {msg}"
                         else:
                             activity_detail = f"{agent_name}: {msg}"
-                    else:
-                        activity_detail = f"{agent_name}: {msg}"
                 elif agent_name != orchestrator.name: 
                     if "Executing task:" in msg or "Executing an task:" in msg :
                         new_overall_status = f"{agent_name}: Executing task..."
@@ -865,7 +905,18 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
 
                 monitor.update(overall_mission_string)
 
+            def on_agent_event(event: Dict[str, Any]):
+                if event.get("event") != "agent_created":
+                    return
+                new_agent_name = event["name"]
+                if new_agent_name not in monitor.all_known_agents:
+                    monitor.add_agent(new_agent_name)
+                    logger.debug(f"Added new agent from orchestrator event: {new_agent_name}")
+                if new_agent_name not in overall_log.created_agents:
+                    overall_log.created_agents.append(new_agent_name)
+
             orchestrator.set_log_callback(live_aware_log_patch) # Set callback here
+            orchestrator.set_agent_event_callback(on_agent_event)
 
             monitor.set_overall_status("Initializing Mission...", is_running=True)
             monitor.add_agent(orchestrator.name)
@@ -880,11 +931,11 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
                 await orchestrator.bootstrap_c_suite(overall_mission_string)
                 
                 # Add all known agents to monitor (C-Suite + any specialists)
-                for agent_name in resume_mission_log.created_agents:
-                    monitor.add_agent(agent_name)
+                monitor.add_agents(resume_mission_log.created_agents)
                 
-                # Update mission log with current agent list
-                overall_log.created_agents = list(orchestrator.agents.keys())
+                # Update mission log with current agent list (kept current afterwards by on_agent_event)
+                created_agents = list(orchestrator.agents.keys())
+                overall_log.created_agents = created_agents
                 
                 console.print(f"[cyan]Restored {len(resume_mission_log.created_agents)} agents from previous mission[/cyan]")
             else:
@@ -893,13 +944,14 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
                 monitor.update(overall_mission_string)
                 await orchestrator.bootstrap_c_suite(overall_mission_string)
                 
+                # Snapshot the agent list once for both the monitor and the mission log
+                created_agents = list(orchestrator.agents.keys())
+                
                 # Add C-Suite agents to monitor
-                for agent_name in orchestrator.agents.keys():
-                    if agent_name not in [orchestrator.name]:
-                        monitor.add_agent(agent_name)
+                monitor.add_agents(agent_name for agent_name in created_agents if agent_name != orchestrator.name)
                 
-                # Track created agents in mission log
-                overall_log.created_agents = list(orchestrator.agents.keys())
+                # Track created agents in mission log (kept current afterwards by on_agent_event)
+                overall_log.created_agents = created_agents
             
             monitor.update(overall_mission_string)
 
@@ -947,7 +999,15 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
             
             # Run continuous loop with user continuation option
             total_iterations_run = 0
-            all_execution_logs = []
+            # Execution logs are journaled to the workspace and only a rolling window stays in memory
+            execution_log_spill_path = None
+            execution_log_spill_start = 0
+            if mission_log.workspace_path:
+                execution_log_spill_path = os.path.join(mission_log.workspace_path, "logs", "execution_log.jsonl")
+                os.makedirs(os.path.dirname(execution_log_spill_path), exist_ok=True)
+                if os.path.exists(execution_log_spill_path):
+                    execution_log_spill_start = os.path.getsize(execution_log_spill_path)
+            all_execution_logs = deque(maxlen=EXECUTION_LOG_WINDOW if execution_log_spill_path else None)
             all_csuite_decisions = []
             final_loop_results = None
             
@@ -959,7 +1019,10 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
                 
                 # Accumulate results
                 total_iterations_run += loop_results.get("total_iterations", 0)
-                all_execution_logs.extend(loop_results.get("execution_log", []))
+                batch_execution_log = loop_results.get("execution_log", [])
+                if execution_log_spill_path:
+                    append_execution_log(execution_log_spill_path, batch_execution_log)
+                all_execution_logs.extend(batch_execution_log)
                 all_csuite_decisions.extend(loop_results.get("csuite_decisions", []))
                 final_loop_results = loop_results
                 
@@ -967,8 +1030,7 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
                 if loop_results.get("final_status") == "max_iterations_reached":
                     # Stop the live display to show user prompt
                     monitor.set_overall_status(f"Reached {max_iterations} iterations. Asking user to continue...", is_running=False)
-                    live.update(monitor.layout)
-                    live.stop()
+                    live.stop()  # stop() performs the final render
                     
                     # Show current progress
                     rprint(Panel(
@@ -1013,7 +1075,6 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
             combined_results = {
                 **final_loop_results,
                 "total_iterations": total_iterations_run,
-                "execution_log": all_execution_logs,
                 "csuite_decisions": all_csuite_decisions
             }
             
@@ -1022,30 +1083,13 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
             overall_log.final_status = combined_results.get("final_status", "completed")
             overall_log.last_activity_description = f"C-Suite orchestrated: {combined_results.get('successful_cycles', 0)} successful cycles, ${combined_results.get('total_revenue_generated', 0.0):.2f} revenue"
             
-            # Convert continuous loop execution log to decision cycles format
-            execution_log = combined_results.get("execution_log", [])
-            for cycle_log in execution_log:
-                cycle_summary = {
-                    "cycle_id": f"csuite_cycle_{cycle_log.get('iteration', 0)}",
-                    "timestamp": cycle_log.get("timestamp", datetime.now().isoformat()),
-                    "decision_focus": f"C-Suite orchestrated iteration {cycle_log.get('iteration', 0)}",
-                    "status": "success" if cycle_log.get("cycle_successful", False) else "failed",
-                    "execution_output": {
-                        "execution_type": "csuite_orchestrated",
-                        "description": f"C-Suite planning + workflow execution: {', '.join(cycle_log.get('steps', {}).keys())}",
-                        "output_data": {
-                            "csuite_planning": cycle_log.get("csuite_planning", {}),
-                            "workflow_steps": cycle_log.get("steps", {}),
-                            "csuite_review": cycle_log.get("csuite_review", {}),
-                            "revenue_generated": cycle_log.get("revenue_generated", 0.0),
-                            "errors": cycle_log.get("errors", []),
-                            "guardrail_status": cycle_log.get("guardrail_status", "OK")
-                        }
-                    },
-                    "total_cycle_cost": calculate_cycle_cost(cycle_log),
-                    "recommendation_text": f"C-Suite cycle {cycle_log.get('iteration', 0)} - Strategic planning + {len(cycle_log.get('steps', {}))} workflow agents"
-                }
-                overall_log.decision_cycles_summary.append(cycle_summary)
+            # Convert continuous loop execution log to decision cycles format. With a workspace the full
+            # history is streamed back from disk, since the in-memory deque only holds the most recent cycles
+            if execution_log_spill_path:
+                execution_log = iter_execution_log(execution_log_spill_path, execution_log_spill_start)
+            else:
+                execution_log = all_execution_logs
+            overall_log.decision_cycles_summary.extend(summarize_execution_log(execution_log))
             
             # Update total decision cycles count
             overall_log.total_decision_cycles = len(overall_log.decision_cycles_summary)
@@ -1054,8 +1098,7 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
             if not live.is_started:
                 live.start()
             monitor.set_overall_status(f"C-Suite Mission Complete: {combined_results.get('final_status', 'unknown')}", is_running=False)
-            live.update(monitor.layout)
-            live.stop()
+            live.stop()  # stop() performs the final render
             
             status_color = "green" if combined_results.get("status") == "completed" else "red"
             rprint(Panel(
@@ -1083,14 +1126,6 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
             overall_log.error_message = str(e)
         sys.exit(1)
     finally:
-        # Cancel timer task if it exists
-        if 'timer_task' in locals() and not timer_task.done():
-            timer_task.cancel()
-            try:
-                await timer_task
-            except asyncio.CancelledError:
-                pass
-        
         if 'live' in locals() and live.is_started:
             live.stop()
         
@@ -1105,7 +1140,9 @@ async def run_mission_cli(overall_mission_string: str, agent_logger: AgentLogger
             if 'monitor' in locals():
                 overall_log.total_input_tokens = monitor.total_input_tokens
                 overall_log.total_output_tokens = monitor.total_output_tokens
-            overall_log.created_agents = list(orchestrator.agents.keys()) if 'orchestrator' in locals() else overall_log.created_agents
+            # created_agents is already tracked once bootstrap has run; only rescan if we failed before that
+            if 'orchestrator' in locals() and 'created_agents' not in locals():
+                overall_log.created_agents = list(orchestrator.agents.keys())
 
         # Save mission data to workspace (primary storage)
         if 'orchestrator' in locals() and 'overall_log' in locals() and orchestrator.current_mission_log:
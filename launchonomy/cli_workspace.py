@@ -12,16 +12,14 @@ Provides command-line tools for managing mission workspaces including:
 
 import os
 import sys
+import re
 import json
 import click
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt, Confirm
 from datetime import datetime
 
 # Add the parent directory to the path so we can import launchonomy modules
@@ -30,7 +28,34 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from launchonomy.core.workspace_manager import WorkspaceManager, WorkspaceConfig
 from launchonomy.core.mission_manager import MissionManager
 
-console = Console()
+class _LazyConsole:
+    """Proxy that creates the Rich console on first use, so --help never imports Rich"""
+    
+    _console = None
+    
+    def get(self):
+        if self._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return self._console
+    
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+console = _LazyConsole()
+
+# Fast ISO-8601 parsing; fromisoformat accepts a trailing 'Z' from Python 3.11
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    if sys.version_info >= (3, 11):
+        _parse_iso = datetime.fromisoformat
+    else:
+        def _parse_iso(timestamp: str) -> datetime:
+            return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+# Collapses non-word runs when deriving a mission ID from a mission name
+_SLUG_RE = re.compile(r"\W+")
 
 @click.group()
 @click.option('--base-dir', default='.launchonomy', help='Base directory for workspaces')
@@ -49,12 +74,14 @@ def workspace(ctx, base_dir):
 @click.pass_context
 def create(ctx, mission_name: str, mission_id: Optional[str], description: Optional[str], tags: Optional[str]):
     """Create a new mission workspace"""
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
     wm: WorkspaceManager = ctx.obj['workspace_manager']
     
     # Generate mission ID if not provided
     if not mission_id:
-        import re
-        safe_name = re.sub(r'\W+', '_', mission_name.lower())
+        safe_name = _SLUG_RE.sub('_', mission_name.lower())
         mission_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_mission_{safe_name}"
     
     # Parse tags
@@ -67,7 +94,7 @@ def create(ctx, mission_name: str, mission_id: Optional[str], description: Optio
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console
+            console=console.get()
         ) as progress:
             task = progress.add_task("Creating workspace...", total=None)
             
@@ -91,12 +118,24 @@ def create(ctx, mission_name: str, mission_id: Optional[str], description: Optio
         ))
         
         # Show directory structure
-        _show_workspace_structure(config.workspace_path)
+        _show_workspace_structure(wm.get_workspace_snapshot(config.mission_id))
         
     except Exception as e:
         console.print(f"[red]❌ Error creating workspace: {e}[/red]")
         sys.exit(1)
 
+def _trunc(text: str, length: int) -> str:
+    """Truncate text to length characters, marking the cut with an ellipsis"""
+    return text if len(text) <= length else text[:length] + "..."
+
+@lru_cache(maxsize=1024)
+def _format_iso_timestamp(timestamp: str) -> str:
+    """Format an ISO timestamp for display, caching results for repeated listings"""
+    try:
+        return _parse_iso(timestamp).strftime('%Y-%m-%d %H:%M')
+    except (ValueError, AttributeError):
+        return timestamp[:16]
+
 @workspace.command()
 @click.option('--status', help='Filter by status (active, paused, completed, archived)')
 @click.option('--tag', help='Filter by tag')
@@ -104,24 +143,15 @@ def create(ctx, mission_name: str, mission_id: Optional[str], description: Optio
 @click.pass_context
 def list(ctx, status: Optional[str], tag: Optional[str], limit: int):
     """List all mission workspaces"""
+    from rich.table import Table
+    
     wm: WorkspaceManager = ctx.obj['workspace_manager']
     
     try:
-        workspaces = wm.list_workspaces(status_filter=status)
-        
-        # Filter by tag if specified
-        if tag:
-            workspaces = [ws for ws in workspaces if tag in ws.tags]
-        
-        # Limit results
-        workspaces = workspaces[:limit]
+        workspaces = wm.list_workspaces(status_filter=status, tag_filter=tag)
         
-        if not workspaces:
-            console.print("[yellow]No workspaces found matching the criteria.[/yellow]")
-            return
-        
-        # Create table
-        table = Table(title=f"Mission Workspaces ({len(workspaces)} found)")
+        # Create table; the title gets the row count once the rows are in
+        table = Table(title="Mission Workspaces")
         table.add_column("Mission ID", style="cyan", no_wrap=True)
         table.add_column("Name", style="green")
         table.add_column("Status", style="yellow")
@@ -129,32 +159,32 @@ def list(ctx, status: Optional[str], tag: Optional[str], limit: int):
         table.add_column("Tags", style="magenta")
         table.add_column("Assets", style="white")
         
-        for ws in workspaces:
-            # Get workspace summary for asset count
-            summary = wm.get_workspace_summary(ws.mission_id)
+        # Stop as soon as the row budget is filled
+        for ws in islice(workspaces, limit):
+            # Asset counts come from a small per-workspace counts file
+            counts = wm.get_asset_counts_fast(ws.mission_id)
             asset_count = "N/A"
-            if summary:
-                total_assets = summary.get('total_assets', 0)
-                total_agents = summary.get('total_agents', 0)
-                total_tools = summary.get('total_tools', 0)
-                asset_count = f"{total_assets} ({total_agents}A, {total_tools}T)"
+            if counts:
+                asset_count = f"{counts['assets']} ({counts['agents']}A, {counts['tools']}T)"
             
             # Format creation date
-            try:
-                created_dt = datetime.fromisoformat(ws.created_at.replace('Z', '+00:00'))
-                created_str = created_dt.strftime('%Y-%m-%d %H:%M')
-            except:
-                created_str = ws.created_at[:16]
+            created_str = _format_iso_timestamp(ws.created_at)
             
             table.add_row(
-                ws.mission_id[:30] + "..." if len(ws.mission_id) > 30 else ws.mission_id,
-                ws.mission_name[:25] + "..." if len(ws.mission_name) > 25 else ws.mission_name,
+                _trunc(ws.mission_id, 30),
+                _trunc(ws.mission_name, 25),
                 ws.status,
                 created_str,
                 ", ".join(ws.tags[:2]) + ("..." if len(ws.tags) > 2 else ""),
                 asset_count
             )
         
+        if not table.row_count:
+            console.print("[yellow]No workspaces found matching the criteria.[/yellow]")
+            return
+        
+        table.title = f"Mission Workspaces ({table.row_count} found)"
+        
         console.print(table)
         
     except Exception as e:
@@ -168,6 +198,9 @@ def list(ctx, status: Optional[str], tag: Optional[str], limit: int):
 @click.pass_context
 def inspect(ctx, mission_id: str, show_assets: bool, show_logs: bool):
     """Inspect a specific workspace in detail"""
+    from rich.panel import Panel
+    from rich.table import Table
+    
     wm: WorkspaceManager = ctx.obj['workspace_manager']
     
     try:
@@ -176,8 +209,9 @@ def inspect(ctx, mission_id: str, show_assets: bool, show_logs: bool):
             console.print(f"[red]❌ Workspace not found: {mission_id}[/red]")
             sys.exit(1)
         
-        # Get workspace summary
-        summary = wm.get_workspace_summary(mission_id)
+        # Materialize everything the displays need with one directory walk
+        snapshot = wm.get_workspace_snapshot(mission_id)
+        summary = snapshot['summary']
         
         # Display workspace information
         console.print(Panel.fit(
@@ -219,7 +253,7 @@ def inspect(ctx, mission_id: str, show_assets: bool, show_logs: bool):
         
         # Show directory structure
         console.print("\n[bold]Directory Structure:[/bold]")
-        _show_workspace_structure(config.workspace_path)
+        _show_workspace_structure(snapshot)
         
         # Show detailed assets if requested
         if show_assets and summary:
@@ -227,7 +261,7 @@ def inspect(ctx, mission_id: str, show_assets: bool, show_logs: bool):
         
         # Show recent logs if requested
         if show_logs:
-            _show_recent_logs(config.workspace_path)
+            _show_recent_logs(snapshot)
             
     except Exception as e:
         console.print(f"[red]❌ Error inspecting workspace: {e}[/red]")
@@ -240,6 +274,9 @@ def inspect(ctx, mission_id: str, show_assets: bool, show_logs: bool):
 @click.pass_context
 def archive(ctx, mission_id: str, archive_path: Optional[str], force: bool):
     """Archive a mission workspace"""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.prompt import Confirm
+    
     wm: WorkspaceManager = ctx.obj['workspace_manager']
     
     try:
@@ -259,7 +296,7 @@ def archive(ctx, mission_id: str, archive_path: Optional[str], force: bool):
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console
+            console=console.get()
         ) as progress:
             task = progress.add_task("Archiving workspace...", total=None)
             
@@ -326,32 +363,22 @@ def update(ctx, mission_id: str, status: Optional[str], add_tag: Optional[str],
         sys.exit(1)
 
 @workspace.command()
+@click.option('--rebuild-stats', is_flag=True, help='Recompute the aggregate stats from every workspace')
 @click.pass_context
-def status(ctx):
+def status(ctx, rebuild_stats: bool):
     """Show overall workspace system status"""
+    from rich.panel import Panel
+    from rich.table import Table
+    
     wm: WorkspaceManager = ctx.obj['workspace_manager']
     
     try:
-        workspaces = wm.list_workspaces()
-        
-        # Calculate statistics
-        total_workspaces = len(workspaces)
-        status_counts = {}
-        tag_counts = {}
-        total_size = 0.0
-        
-        for ws in workspaces:
-            # Count by status
-            status_counts[ws.status] = status_counts.get(ws.status, 0) + 1
-            
-            # Count tags
-            for tag in ws.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-            
-            # Calculate total size
-            summary = wm.get_workspace_summary(ws.mission_id)
-            if summary:
-                total_size += summary.get('storage_size_mb', 0)
+        # Aggregates are maintained incrementally on disk
+        stats = wm.get_workspace_stats(rebuild=rebuild_stats)
+        total_workspaces = stats['total_workspaces']
+        status_counts = Counter(stats['status_counts'])
+        tag_counts = Counter(stats['tag_counts'])
+        total_size = stats['total_size_mb']
         
         # Display system status
         console.print(Panel.fit(
@@ -379,45 +406,42 @@ def status(ctx):
         # Top tags
         if tag_counts:
             console.print("\n[bold]Most Common Tags:[/bold]")
-            sorted_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
-            for tag, count in sorted_tags[:5]:
+            for tag, count in tag_counts.most_common(5):
                 console.print(f"  • {tag}: {count} workspace{'s' if count != 1 else ''}")
                 
     except Exception as e:
         console.print(f"[red]❌ Error getting system status: {e}[/red]")
         sys.exit(1)
 
-def _show_workspace_structure(workspace_path: str):
-    """Show the directory structure of a workspace"""
+def _show_workspace_structure(snapshot: Dict[str, Any]):
+    """Show the directory structure of a workspace from its snapshot"""
+    from rich.tree import Tree
+    
     try:
+        workspace_path = snapshot['config'].get('workspace_path') if snapshot else None
         if not workspace_path:
             console.print("[red]No workspace path provided[/red]")
             return
-            
-        workspace_dir = Path(workspace_path)
         
-        if not workspace_dir.exists():
+        if snapshot['structure'] is None:
             console.print(f"[red]Workspace directory does not exist: {workspace_path}[/red]")
             return
         
-        tree = Tree(f"📁 {workspace_dir.name}")
+        tree = Tree(f"📁 {Path(workspace_path).name}")
         
         # Add main directories and files
-        for item in sorted(workspace_dir.iterdir()):
-            if item.is_dir():
-                # Count items in directory
-                try:
-                    item_count = len(list(item.iterdir()))
-                    if item_count == 0:
-                        tree.add(f"📁 {item.name}/ [dim](empty)[/dim]")
-                    else:
-                        tree.add(f"📁 {item.name}/ [dim]({item_count} items)[/dim]")
-                except PermissionError:
-                    tree.add(f"📁 {item.name}/ [red](permission denied)[/red]")
-                except Exception:
-                    tree.add(f"📁 {item.name}/")
+        for item in snapshot['structure']:
+            if item['is_dir']:
+                if item['error']:
+                    tree.add(f"📁 {item['name']}/ [red]({item['error']})[/red]")
+                elif item['item_count'] is None:
+                    tree.add(f"📁 {item['name']}/")
+                elif item['item_count'] == 0:
+                    tree.add(f"📁 {item['name']}/ [dim](empty)[/dim]")
+                else:
+                    tree.add(f"📁 {item['name']}/ [dim]({item['item_count']} items)[/dim]")
             else:
-                tree.add(f"📄 {item.name}")
+                tree.add(f"📄 {item['name']}")
         
         console.print(tree)
         
@@ -449,34 +473,17 @@ def _show_detailed_assets(summary: Dict[str, Any]):
         for asset in recent_assets[:10]:
             console.print(f"  • {asset['name']} ({asset['type']}) - {asset['created_at'][:16]}")
 
-def _show_recent_logs(workspace_path: str):
-    """Show recent log entries"""
+def _show_recent_logs(snapshot: Dict[str, Any]):
+    """Show recent log entries from a workspace snapshot"""
     console.print("\n[bold]Recent Logs:[/bold]")
     
-    logs_dir = Path(workspace_path) / "logs"
-    if not logs_dir.exists():
+    if snapshot['recent_logs'] is None:
         console.print("  No logs directory found")
         return
     
-    try:
-        # Find recent log files
-        log_files = []
-        for log_file in logs_dir.rglob("*.json"):
-            if log_file.is_file():
-                stat = log_file.stat()
-                log_files.append((log_file, stat.st_mtime))
-        
-        # Sort by modification time (newest first)
-        log_files.sort(key=lambda x: x[1], reverse=True)
-        
-        # Show first 5 log files
-        for log_file, mtime in log_files[:5]:
-            relative_path = log_file.relative_to(logs_dir)
-            mod_time = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M')
-            console.print(f"  • {relative_path} - {mod_time}")
-            
-    except Exception as e:
-        console.print(f"  [red]Error reading logs: {e}[/red]")
+    for log_file in snapshot['recent_logs']:
+        mod_time = datetime.fromtimestamp(log_file['modified']).strftime('%Y-%m-%d %H:%M')
+        console.print(f"  • {log_file['path']} - {mod_time}")
 
 if __name__ == '__main__':
     workspace() 
\ No newline at end of file
@@ -4,11 +4,24 @@ Core orchestration components for Launchonomy.
 This module contains the main orchestrator and supporting management classes.
 """
 
-from .orchestrator import OrchestrationAgent, create_orchestrator
-from .mission_manager import MissionManager, MissionLog, CycleLog
-from .agent_manager import AgentManager, TemplateError, load_template
-from .communication import AgentCommunicator, ReviewManager, AgentCommunicationError
-from .workspace_manager import WorkspaceManager, WorkspaceConfig, AssetManifest
+# Exports are resolved on first access so importing a single core module
+# (e.g. the workspace manager) does not pull in the orchestrator stack.
+_LAZY_EXPORTS = {
+    "OrchestrationAgent": ".orchestrator",
+    "create_orchestrator": ".orchestrator",
+    "MissionManager": ".mission_manager",
+    "MissionLog": ".mission_manager",
+    "CycleLog": ".mission_manager",
+    "AgentManager": ".agent_manager",
+    "TemplateError": ".agent_manager",
+    "load_template": ".agent_manager",
+    "AgentCommunicator": ".communication",
+    "ReviewManager": ".communication",
+    "AgentCommunicationError": ".communication",
+    "WorkspaceManager": ".workspace_manager",
+    "WorkspaceConfig": ".workspace_manager",
+    "AssetManifest": ".workspace_manager",
+}
 
 __all__ = [
     "OrchestrationAgent",
@@ -25,4 +38,13 @@ __all__ = [
     "WorkspaceManager",
     "WorkspaceConfig",
     "AssetManifest"
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
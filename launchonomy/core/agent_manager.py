@@ -2,38 +2,177 @@
 
 import os
 import re
+import asyncio
 import json
 import logging
+import functools
 import importlib
 import inspect
+import string
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
-from autogen_core import RoutedAgent
-from autogen_ext.models.openai import OpenAIChatCompletionClient
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple, TYPE_CHECKING
+
+# autogen pulls in heavy dependencies; it is imported where agents are actually created
+if TYPE_CHECKING:
+    from autogen_core import RoutedAgent
+    from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 logger = logging.getLogger(__name__)
 
+# Collapses non-word runs when turning a role into an agent name
+_SANE_NAME_RE = re.compile(r'\W+')
+
 class TemplateError(Exception):
     """Raised when a template cannot be loaded."""
     pass
 
+# Loaded template text by resolved file path, so a change of working directory finds the right file
+_TEMPLATE_CACHE: Dict[str, str] = {}
+
 def load_template(name: str) -> str:
-    """Load a template file with error handling."""
+    """Load a template file with error handling. Loaded templates are cached per resolved path."""
+    # Try relative path first (when running from launchonomy directory), then the launchonomy package path
+    candidates = (os.path.join("templates", f"{name}.txt"), os.path.join("launchonomy", "templates", f"{name}.txt"))
     try:
-        # Try relative path first (when running from launchonomy directory)
-        path = os.path.join("templates", f"{name}.txt")
-        if not os.path.exists(path):
-            # Fallback to launchonomy package path
-            path = os.path.join("launchonomy", "templates", f"{name}.txt")
-        
-        with open(path) as f:
-            return f.read().strip()
-    except FileNotFoundError:
-        logger.error(f"Template file not found: {path}")
-        raise TemplateError(f"Template '{name}' not found")
+        for path in candidates:
+            path = os.path.abspath(path)
+            if path in _TEMPLATE_CACHE:
+                return _TEMPLATE_CACHE[path]
+            try:
+                f = open(path)
+            except FileNotFoundError:
+                continue
+            with f:
+                template = f.read().strip()
+            _TEMPLATE_CACHE[path] = template
+            return template
     except Exception as e:
         logger.error(f"Error loading template {name}: {str(e)}")
         raise TemplateError(f"Error loading template '{name}': {str(e)}")
+    
+    logger.error(f"Template file not found: {path}")
+    raise TemplateError(f"Template '{name}' not found")
+
+@functools.lru_cache(maxsize=None)
+def _ctor_param_names(cls) -> frozenset:
+    """Get the constructor parameter names of an agent class, introspecting each class once."""
+    return frozenset(inspect.signature(cls.__init__).parameters)
+
+@functools.lru_cache(maxsize=None)
+def _agent_class():
+    """Define the RoutedAgent subclass used for created agents, importing autogen on first use."""
+    from autogen_core import RoutedAgent
+
+    class _LaunchonomyAgent(RoutedAgent):
+        """RoutedAgent carrying the model client, log callback and name set by AgentManager."""
+
+        def __init__(self, description: str, client, log_callback, name: str):
+            super().__init__(description)
+            self._client = client
+            self.log_callback = log_callback
+            self.name = name
+
+    return _LaunchonomyAgent
+
+class CSuiteSpec(NamedTuple):
+    """Static description of one founding C-Suite agent."""
+    name: str
+    persona: str
+    expertise: str
+    responsibilities: str
+
+# C-Suite agents as specified in the orchestrator primer
+C_SUITE_SPECS: Tuple[CSuiteSpec, ...] = (
+    CSuiteSpec(
+        name="CEO-Agent",
+        persona="Chief Executive Officer focused on vision & prioritization",
+        expertise="strategic vision, business prioritization, executive decision-making, market positioning",
+        responsibilities="defines vision & prioritization for the business mission"
+    ),
+    CSuiteSpec(
+        name="CRO-Agent",
+        persona="Chief Revenue Officer focused on customer acquisition & revenue",
+        expertise="sales strategy, customer acquisition, revenue optimization, conversion funnels",
+        responsibilities="focuses on customer acquisition & revenue generation"
+    ),
+    CSuiteSpec(
+        name="CTO-Agent",
+        persona="Chief Technology Officer owning technical infrastructure & tools",
+        expertise="technical architecture, infrastructure, development tools, system integration",
+        responsibilities="owns technical infrastructure & tools implementation"
+    ),
+    CSuiteSpec(
+        name="CPO-Agent",
+        persona="Chief Product Officer owning product/UX experiments & A/B tests",
+        expertise="product strategy, user experience, A/B testing, product optimization",
+        responsibilities="owns product/UX experiments & A/B tests"
+    ),
+    CSuiteSpec(
+        name="CMO-Agent",
+        persona="Chief Marketing Officer owning marketing channels & growth hacks",
+        expertise="marketing strategy, growth hacking, channel optimization, brand positioning",
+        responsibilities="owns marketing channels & growth hacks"
+    ),
+    CSuiteSpec(
+        name="CDO-Agent",
+        persona="Chief Data Officer owning data strategy, quality, and insights",
+        expertise="data strategy, analytics, data quality, business intelligence",
+        responsibilities="owns data strategy, quality, and insights"
+    ),
+    CSuiteSpec(
+        name="CCO-Agent",
+        persona="Chief Compliance Officer owning compliance, legal, and regulatory risk",
+        expertise="legal compliance, regulatory requirements, risk management, business law",
+        responsibilities="owns compliance, legal, and regulatory risk"
+    ),
+    CSuiteSpec(
+        name="CFO-Agent",
+        persona="Chief Financial Officer overseeing budgets, profitability & reinvestment strategy",
+        expertise="financial planning, budget management, profitability analysis, investment strategy",
+        responsibilities="oversees budgets, profitability & reinvestment strategy"
+    ),
+    CSuiteSpec(
+        name="CCSO-Agent",
+        persona="Chief Customer Success Officer owning post-purchase journey: onboarding, support, retention & advocacy",
+        expertise="customer success, onboarding, support systems, retention strategies",
+        responsibilities="owns post-purchase journey: onboarding, support, retention & advocacy"
+    ),
+)
+
+_C_SUITE_PROMPT_SKELETON = """You are {name}, the {persona}.
+
+Mission Context: $mission_context
+
+Your Role & Responsibilities:
+{responsibilities}
+
+Your Core Expertise:
+{expertise}
+
+Operating Principles (from Launchonomy Primer):
+• Objective: Acquire the first paying customer as fast as possible, then ignite exponential, profitable growth—automatically and without human plan approvals
+• Budget Constraint: Initial budget $$500, profit guardrail: total costs never exceed 20% of revenue
+• Self-Governing: You participate in unanimous consensus voting for all proposals
+• Specialization: When faced with tasks beyond your scope, propose creation of new agents/tools
+• No Human Approval: Plans never go to humans—only system-critical failures do
+
+You are part of the founding C-Suite team working together through consensus to achieve the mission. Always consider your specialized perspective while collaborating with other C-Suite agents for unanimous decisions."""
+
+# Per-agent system prompts with the static fields filled in once at import;
+# bootstrap only substitutes $mission_context
+_C_SUITE_PROMPT_TEMPLATES = {
+    spec.name: string.Template(_C_SUITE_PROMPT_SKELETON.format(
+        **{field: value.replace("$", "$$") for field, value in spec._asdict().items()}
+    ))
+    for spec in C_SUITE_SPECS
+}
+
+# Primer for specialists without a dedicated specialist_<name> template
+_DEFAULT_PRIMER = (
+    "You are {role}. {persona}.\n"
+    "Your core expertise lies in: {expertise}.\n"
+    "Focus on your specialized role to address the tasks given to you."
+)
 
 class AgentManager:
     """
@@ -46,33 +185,56 @@ class AgentManager:
     - Bootstrapping C-Suite agents
     """
     
-    def __init__(self, registry, client: OpenAIChatCompletionClient, log_callback=None):
+    # Logger method per _log msg_type; anything else logs at info
+    _LOG_METHODS = {
+        "error": logger.error,
+        "warning": logger.warning,
+        "debug": logger.debug,
+        "info": logger.info,
+    }
+    
+    def __init__(self, registry, client: "OpenAIChatCompletionClient", log_callback=None, agent_event_callback=None):
         self.registry = registry
         self.client = client
         self.log_callback = log_callback
-        self.agents: Dict[str, RoutedAgent] = {}
+        self.agent_event_callback = agent_event_callback
+        self.agents: Dict[str, "RoutedAgent"] = {}
         self.c_suite_bootstrapped = False
+        # Next numeric suffix to try per base agent name
+        self._name_counters: Dict[str, int] = {}
 
     def _log(self, message: str, msg_type: str = "info"):
         """Log a message using the callback if available."""
-        # Ensure message is a string
-        if not isinstance(message, str):
-            try:
-                message = str(message)
-            except (TypeError, ValueError, AttributeError) as e:
-                message = f"Failed to convert log message to string: {e}"
-
         if self.log_callback:
+            # Callbacks expect text; logger calls below stringify via %s themselves
+            if not isinstance(message, str):
+                message = str(message)
             self.log_callback("AgentManager", message, msg_type)
         # Standard logging as well
-        if msg_type == "error":
-            logger.error(f"AgentManager: {message}")
-        elif msg_type == "warning":
-            logger.warning(f"AgentManager: {message}")
-        elif msg_type == "debug":
-            logger.debug(f"AgentManager: {message}")
-        else:
-            logger.info(f"AgentManager: {message}")
+        self._LOG_METHODS.get(msg_type, logger.info)("AgentManager: %s", message)
+
+    def _unique_agent_name(self, base_name: str) -> str:
+        """Get an unused agent name, suffixing _1, _2, ... from a per-name counter."""
+        if base_name not in self.agents:
+            return base_name
+        
+        counter = self._name_counters.get(base_name, 1)
+        # Only loops if a suffixed name was registered by some other path
+        while f"{base_name}_{counter}" in self.agents:
+            counter += 1
+        self._name_counters[base_name] = counter + 1
+        return f"{base_name}_{counter}"
+
+    @staticmethod
+    def _import_agent_module(module_name: str):
+        """Import an agent module, retrying without the orchestrator prefix."""
+        try:
+            return importlib.import_module(module_name)
+        except ImportError:
+            # Try without the orchestrator prefix if running from root directory
+            if module_name.startswith("orchestrator."):
+                return importlib.import_module(module_name[len("orchestrator."):])
+            raise
 
     def load_registered_agents(self):
         """Load and instantiate all registered agents at startup."""
@@ -81,6 +243,8 @@ class AgentManager:
         agent_names = self.registry.list_agent_names()
         loaded_count = 0
         failed_count = 0
+        # Resolved agent modules by registry module path
+        module_cache: Dict[str, Any] = {}
         
         for name in agent_names:
             try:
@@ -95,21 +259,14 @@ class AgentManager:
                     
                 info = self.registry.get_agent_info(name)
                 if info and 'module' in info and 'class' in info:
-                    # Dynamically import and instantiate the agent
-                    try:
-                        module = importlib.import_module(info["module"])
-                    except ImportError:
-                        # Try without the orchestrator prefix if running from root directory
-                        if info["module"].startswith("orchestrator."):
-                            module_name = info["module"][len("orchestrator."):]
-                            module = importlib.import_module(module_name)
-                        else:
-                            raise
+                    # Dynamically import and instantiate the agent; many agents share a module
+                    module = module_cache.get(info["module"])
+                    if module is None:
+                        module = module_cache[info["module"]] = self._import_agent_module(info["module"])
                     cls = getattr(module, info["class"])
                     
                     # Check which parameter name the constructor expects
-                    sig = inspect.signature(cls.__init__)
-                    param_names = list(sig.parameters.keys())
+                    param_names = _ctor_param_names(cls)
                     
                     # Instantiate with appropriate parameter name
                     if 'coa' in param_names:
@@ -123,12 +280,14 @@ class AgentManager:
                     # Set the client and other attributes
                     agent_instance._client = self.client
                     agent_instance.log_callback = self.log_callback
-                    if not hasattr(agent_instance, 'name'):
+                    if getattr(agent_instance, 'name', None) is None:
                         agent_instance.name = name
                     
                     self.agents[name] = agent_instance
                     loaded_count += 1
-                    self._log(f"✅ Loaded agent: {name} from {info['module']}.{info['class']}", "debug")
+                    # Per-agent message: skip building it when nobody will see it
+                    if self.log_callback or logger.isEnabledFor(logging.DEBUG):
+                        self._log(f"✅ Loaded agent: {name} from {info['module']}.{info['class']}", "debug")
                     
                 else:
                     # For agents without module/class info, create placeholder or skip
@@ -145,7 +304,7 @@ class AgentManager:
         
         self._log(f"Agent loading complete: {loaded_count} loaded, {failed_count} failed, {len(agent_names)} total", "info")
 
-    async def create_agent(self, role_name: str, persona: str, primer: str) -> RoutedAgent:
+    async def create_agent(self, role_name: str, persona: str, primer: str) -> "RoutedAgent":
         """Create a new agent with the given role and primer."""
         try:
             self._log(f"Creating new agent: '{role_name}' ({persona[:50]}...)", "info")
@@ -154,12 +313,11 @@ class AgentManager:
 
             full_system_prompt = f"You are {role_name}. {persona}\n\n{primer}"
             # Agent creation itself is not an LLM call, so no direct cost.
-            agent = RoutedAgent(full_system_prompt) 
-            agent._client = self.client 
-            agent.log_callback = self.log_callback 
-            agent.name = role_name 
+            agent = _agent_class()(full_system_prompt, self.client, self.log_callback, role_name)
             self.agents[role_name] = agent # Register agent
             self._log(f"Agent '{role_name}' created successfully.", "info")
+            if self.agent_event_callback:
+                self.agent_event_callback({"event": "agent_created", "name": role_name})
             return agent # Return the created agent instance
         except Exception as e:
             self._log(f"Failed to create agent '{role_name}': {str(e)}", "error")
@@ -170,10 +328,11 @@ class AgentManager:
                                        agent_management_logs: List[dict],
                                        json_parsing_logs: List[dict],
                                        communicator
-                                       ) -> Tuple[RoutedAgent, float]: # Returns Agent, Cost
+                                       ) -> Tuple["RoutedAgent", float]: # Returns Agent, Cost
         """Create a specialized agent. Logs creation event. Returns agent and creation cost."""
+        # Timestamped when the event is appended to the management logs
         creation_event = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": None,
             "event_type": "agent_creation_attempt",
             "decision_context": decision,
             "agent_name": None, "role": None, "persona": None, "expertise": None,
@@ -199,8 +358,7 @@ class AgentManager:
                 "persona": f"an AI assistant specialized for {decision[:30]}...",
                 "expertise": "general problem solving"
             }
-            
-            creation_event["cost_of_spec_generation"] = 0.0  # No LLM call made
+            # No LLM call made, so cost_of_spec_generation stays 0.0
             
             # Use the 'name' from spec as the primary basis for role and template lookup
             agent_name_from_spec = agent_spec.get("name", "SpecialistAgent")
@@ -208,18 +366,12 @@ class AgentManager:
             persona = agent_spec.get("persona", f"an AI assistant specialized for {decision[:30]}...")
             expertise = agent_spec.get("expertise", "general problem solving")
             
-            creation_event["role"] = role
-            creation_event["persona"] = persona
-            creation_event["expertise"] = expertise
+            creation_event.update(role=role, persona=persona, expertise=expertise)
 
-            sane_role_name = re.sub(r'\W+', '_', role)
+            sane_role_name = _SANE_NAME_RE.sub('_', role)
             if not sane_role_name: 
                 sane_role_name = "Specialist"
-            base_sane_role_name = sane_role_name
-            counter = 1
-            while sane_role_name in self.agents:
-                sane_role_name = f"{base_sane_role_name}_{counter}"
-                counter += 1
+            sane_role_name = self._unique_agent_name(sane_role_name)
             creation_event["agent_name"] = sane_role_name
             
             try:
@@ -230,15 +382,12 @@ class AgentManager:
                 creation_event["primer_source"] = f"template: specialist_{template_name_to_try}.txt"
             except TemplateError:
                 self._log(f"No specific template for role '{template_name_to_try}'. Constructing primer for {sane_role_name} from spec.", "info")
-                primer = (
-                    f"You are {sane_role_name}. {persona}.\n"
-                    f"Your core expertise lies in: {expertise}.\n"
-                    "Focus on your specialized role to address the tasks given to you."
-                )
+                primer = _DEFAULT_PRIMER.format(role=sane_role_name, persona=persona, expertise=expertise)
                 creation_event["primer_source"] = "generated_from_spec"
             
             created_agent = await self.create_agent(sane_role_name, persona, primer)
             creation_event["status"] = "success"
+            creation_event["timestamp"] = datetime.now().isoformat()
             agent_management_logs.append(creation_event)
             return created_agent, accumulated_creation_cost
 
@@ -255,16 +404,13 @@ class AgentManager:
                 generic_primer = "You are a generic specialist AI agent. Use your analytical skills to address the task."
                 creation_event["primer_source"] = "hardcoded_generic (fallback)"
 
-            generic_agent_name = "FallbackGenericSpecialist"
-            counter = 1
-            while generic_agent_name in self.agents:
-                generic_agent_name = f"FallbackGenericSpecialist_{counter}"
-                counter += 1
+            generic_agent_name = self._unique_agent_name("FallbackGenericSpecialist")
             
             creation_event["agent_name"] = generic_agent_name
             creation_event["role"] = "FallbackGenericSpecialist"
             
             fallback_agent = await self.create_agent(generic_agent_name, "a generic AI assistant for fallback scenarios", generic_primer)
+            creation_event["timestamp"] = datetime.now().isoformat()
             agent_management_logs.append(creation_event)
             return fallback_agent, accumulated_creation_cost
 
@@ -279,107 +425,40 @@ class AgentManager:
 
         self._log("Bootstrapping C-Suite agents as per orchestrator primer...", "info")
         
-        # Define the C-Suite agents as specified in the primer
-        c_suite_specs = {
-            "CEO-Agent": {
-                "persona": "Chief Executive Officer focused on vision & prioritization",
-                "expertise": "strategic vision, business prioritization, executive decision-making, market positioning",
-                "responsibilities": "defines vision & prioritization for the business mission"
-            },
-            "CRO-Agent": {
-                "persona": "Chief Revenue Officer focused on customer acquisition & revenue",
-                "expertise": "sales strategy, customer acquisition, revenue optimization, conversion funnels",
-                "responsibilities": "focuses on customer acquisition & revenue generation"
-            },
-            "CTO-Agent": {
-                "persona": "Chief Technology Officer owning technical infrastructure & tools",
-                "expertise": "technical architecture, infrastructure, development tools, system integration",
-                "responsibilities": "owns technical infrastructure & tools implementation"
-            },
-            "CPO-Agent": {
-                "persona": "Chief Product Officer owning product/UX experiments & A/B tests",
-                "expertise": "product strategy, user experience, A/B testing, product optimization",
-                "responsibilities": "owns product/UX experiments & A/B tests"
-            },
-            "CMO-Agent": {
-                "persona": "Chief Marketing Officer owning marketing channels & growth hacks",
-                "expertise": "marketing strategy, growth hacking, channel optimization, brand positioning",
-                "responsibilities": "owns marketing channels & growth hacks"
-            },
-            "CDO-Agent": {
-                "persona": "Chief Data Officer owning data strategy, quality, and insights",
-                "expertise": "data strategy, analytics, data quality, business intelligence",
-                "responsibilities": "owns data strategy, quality, and insights"
-            },
-            "CCO-Agent": {
-                "persona": "Chief Compliance Officer owning compliance, legal, and regulatory risk",
-                "expertise": "legal compliance, regulatory requirements, risk management, business law",
-                "responsibilities": "owns compliance, legal, and regulatory risk"
-            },
-            "CFO-Agent": {
-                "persona": "Chief Financial Officer overseeing budgets, profitability & reinvestment strategy",
-                "expertise": "financial planning, budget management, profitability analysis, investment strategy",
-                "responsibilities": "oversees budgets, profitability & reinvestment strategy"
-            },
-            "CCSO-Agent": {
-                "persona": "Chief Customer Success Officer owning post-purchase journey: onboarding, support, retention & advocacy",
-                "expertise": "customer success, onboarding, support systems, retention strategies",
-                "responsibilities": "owns post-purchase journey: onboarding, support, retention & advocacy"
-            }
-        }
-
         bootstrap_cost = 0.0
         
-        for agent_name, spec in c_suite_specs.items():
-            try:
-                # Check if agent already exists
-                if agent_name in self.agents:
-                    self._log(f"C-Suite agent {agent_name} already exists, skipping creation.", "debug")
-                    continue
-                
-                # Create comprehensive system prompt with mission context
-                system_prompt = f"""You are {agent_name}, the {spec['persona']}.
-
-Mission Context: {mission_context}
-
-Your Role & Responsibilities:
-{spec['responsibilities']}
-
-Your Core Expertise:
-{spec['expertise']}
-
-Operating Principles (from Launchonomy Primer):
-• Objective: Acquire the first paying customer as fast as possible, then ignite exponential, profitable growth—automatically and without human plan approvals
-• Budget Constraint: Initial budget $500, profit guardrail: total costs never exceed 20% of revenue
-• Self-Governing: You participate in unanimous consensus voting for all proposals
-• Specialization: When faced with tasks beyond your scope, propose creation of new agents/tools
-• No Human Approval: Plans never go to humans—only system-critical failures do
-
-You are part of the founding C-Suite team working together through consensus to achieve the mission. Always consider your specialized perspective while collaborating with other C-Suite agents for unanimous decisions."""
-
-                # Create the agent
-                agent = await self.create_agent(agent_name, spec['persona'], system_prompt)
-                
-                # C-Suite agents are managed in AgentManager only, not in registry
-                # They are temporary and should not appear in registry listings
-                
-                self._log(f"✅ Bootstrapped {agent_name}: {spec['persona']}", "info")
-                
-            except Exception as e:
-                self._log(f"❌ Failed to bootstrap {agent_name}: {str(e)}", "error")
-                # Continue with other agents even if one fails
+        # Create the agents concurrently; one failure does not stop the others
+        results = await asyncio.gather(
+            *(self._bootstrap_one(spec, mission_context) for spec in C_SUITE_SPECS),
+            return_exceptions=True
+        )
+        for spec, result in zip(C_SUITE_SPECS, results):
+            if isinstance(result, Exception):
+                self._log(f"❌ Failed to bootstrap {spec.name}: {str(result)}", "error")
         
         self.c_suite_bootstrapped = True
         self._log(f"🎉 C-Suite bootstrap complete! Active agents: {len(self.agents)}", "info")
         
         return bootstrap_cost
 
+    async def _bootstrap_one(self, spec: CSuiteSpec, mission_context: str):
+        """Create a single C-Suite agent unless it already exists."""
+        if spec.name in self.agents:
+            self._log(f"C-Suite agent {spec.name} already exists, skipping creation.", "debug")
+            return
+        
+        # Only the mission context varies between bootstraps
+        system_prompt = _C_SUITE_PROMPT_TEMPLATES[spec.name].substitute(mission_context=mission_context)
+        
+        # C-Suite agents are managed in AgentManager only, not in registry
+        # They are temporary and should not appear in registry listings
+        await self.create_agent(spec.name, spec.persona, system_prompt)
+        self._log(f"✅ Bootstrapped {spec.name}: {spec.persona}", "info")
+
     async def cleanup_agents(self):
         """Clean up agents after mission completion."""
-        agent_names_to_remove = list(self.agents.keys())
-        self._log(f"Starting cleanup of {len(agent_names_to_remove)} agents.", "debug")
-        for agent_name in agent_names_to_remove:
-            # No explicit client close needed for autogen_ext.models.openai.OpenAIChatCompletionClient
-            if agent_name in self.agents:
-                 del self.agents[agent_name]
+        self._log(f"Starting cleanup of {len(self.agents)} agents.", "debug")
+        # No explicit client close needed for autogen_ext.models.openai.OpenAIChatCompletionClient
+        self.agents.clear()
+        self._name_counters.clear()
         self._log(f"Cleaned up agents. Active agents now: {len(self.agents)}", "info") 
\ No newline at end of file
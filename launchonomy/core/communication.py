@@ -1,16 +1,143 @@
 # orchestrator/agent_communication.py
 
 import json
-import re
 import asyncio
+import hashlib
 import logging
+import random
+import weakref
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from autogen_core import RoutedAgent
 from autogen_core.models import SystemMessage, UserMessage
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+def _json_loads(text: str) -> Any:
+    """Parse JSON, using orjson when available. orjson's decode error subclasses json.JSONDecodeError."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+def _json_dumps(data: Any) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data)
+
+def _extract_cost(response: Any) -> float:
+    """Get a model call's cost from the response or its usage (object or dict); 0.0 when not reported."""
+    cost = getattr(response, 'cost', None)
+    if isinstance(cost, (int, float)):
+        return float(cost)
+    # Usage details are implementation dependent
+    usage = getattr(response, 'usage', None)
+    if not usage:
+        return 0.0
+    cost = usage.get('total_cost') if isinstance(usage, dict) else getattr(usage, 'total_cost', None)
+    return float(cost) if isinstance(cost, (int, float)) else 0.0
+
+_JSON_FENCE = "```json"
+
+def _mentions_json(prompt: str) -> bool:
+    """Whether a prompt mentions JSON in any letter case."""
+    # Literal searches cover the usual spellings; a lowercased copy is only needed for odd casings.
+    # Both beat a case-insensitive regex, which scans far slower than str.lower().
+    if "json" in prompt or "JSON" in prompt or "Json" in prompt:
+        return True
+    return "json" in prompt.lower()
+
+def _find_json_start(text: str, start: int = 0) -> int:
+    """Index of the first { or [ at or after start, or -1."""
+    obj_start = text.find("{", start)
+    arr_start = text.find("[", start)
+    if obj_start == -1 or (arr_start != -1 and arr_start < obj_start):
+        return arr_start
+    return obj_start
+
+def _scan_json_span(text: str, start: int = 0) -> Optional[str]:
+    """
+    Return the first balanced {...} or [...] span at or after start, or None.
+    Single pass over the text; brackets inside JSON strings are ignored.
+    """
+    obj_start = _find_json_start(text, start)
+    if obj_start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(obj_start, len(text)):
+        char = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return text[obj_start:i + 1]
+    return None
+
+_JSON_DECODER = json.JSONDecoder()
+
+def _decode_json_reply(text: str) -> Optional[Tuple[str, Any]]:
+    """
+    Parse the JSON value extract_json_from_string would pick, straight from the reply with the
+    C decoder, returning (source span, value). None when that value is not valid JSON on its own;
+    callers then fall back to the bracket scanner to report the error.
+    """
+    fence = text.find(_JSON_FENCE)
+    start = _find_json_start(text, fence + len(_JSON_FENCE) if fence != -1 else 0)
+    if start == -1:
+        return None
+    try:
+        value, end = _JSON_DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return None
+    return text[start:end], value
+
+# Longest prompt/response text kept in JSON parsing logs unless verbose logging is on
+_LOG_SNIPPET_CHARS = 512
+
+# Feedback appended to the prompt when a JSON response could not be parsed
+_RETRY_PREFIX = (
+    "\n\nYour previous response was not valid JSON. Please ensure your entire response is a single, valid JSON object "
+    "(starting with { and ending with } or starting with [ and ending with ]) without any surrounding text or explanations. "
+    "The error was: "
+)
+_RETRY_MID = ". The raw response started with: '"
+_RETRY_SUFFIX = "...'"
+# Feedback for replies that stopped before their JSON closed; repeating the
+# parse error would not help, the agent has to answer more briefly
+_TRUNCATED_RETRY = (
+    "\n\nYour previous response was cut off before the JSON was complete. "
+    "Reply again with the complete JSON object only, keeping every string value concise so the whole "
+    "object fits in a single response."
+)
+
+def _retry_delay(retry_number: int) -> float:
+    """
+    Seconds to wait before the given JSON retry (1-based): exponential from ~1s, capped at 16s,
+    with +/-50% jitter so concurrent reviewers hitting a rate limit do not retry in lockstep.
+    """
+    return min(16.0, 0.5 * 2 ** retry_number) * (0.5 + random.random())
+
 class AgentCommunicationError(Exception):
     """Raised when agent communication fails."""
     pass
@@ -26,23 +153,73 @@ class EnhancedAgentCommunicator:
     - Structured JSON parsing
     """
     
-    def __init__(self, max_json_retries: int = 2):
+    def __init__(self, max_json_retries: int = 2, verbose_logging: bool = False,
+                 max_concurrent_llm_calls: int = 8):
         self.MAX_JSON_RETRIES = max_json_retries
-        self.conversation_histories: Dict[str, List] = {}  # Track conversation per agent
+        # JSON parsing logs keep full prompts and responses only when verbose
+        self.verbose_logging = verbose_logging
+        self.conversation_histories: Dict[str, Deque] = {}  # Track conversation per agent
+        # SystemMessage built from each agent's own system_prompt, reused while the prompt is unchanged
+        self._system_message_cache: "weakref.WeakKeyDictionary[RoutedAgent, SystemMessage]" = weakref.WeakKeyDictionary()
+        # Cap on model calls in flight across all agents and reviewers; 0 disables it
+        self.max_concurrent_llm_calls = max_concurrent_llm_calls
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None
+        self._llm_semaphore_loop = None
         
+    def _log_text(self, text: str) -> str:
+        """Text as stored in parsing logs: complete when verbose, otherwise a bounded snippet."""
+        if self.verbose_logging or len(text) <= _LOG_SNIPPET_CHARS:
+            return text
+        return text[:_LOG_SNIPPET_CHARS] + "..."
+
+    def _llm_call_slots(self) -> Optional[asyncio.Semaphore]:
+        """Semaphore shared by all model calls on the running event loop, or None when uncapped."""
+        if self.max_concurrent_llm_calls <= 0:
+            return None
+        # asyncio primitives belong to one loop, so a new loop gets its own semaphore
+        loop = asyncio.get_running_loop()
+        if self._llm_semaphore_loop is not loop:
+            self._llm_semaphore = asyncio.Semaphore(self.max_concurrent_llm_calls)
+            self._llm_semaphore_loop = loop
+        return self._llm_semaphore
+
     def _get_agent_id(self, agent: RoutedAgent) -> str:
         """Get unique identifier for agent."""
         return getattr(agent, 'name', f'agent_{id(agent)}')
     
     def _add_to_history(self, agent_id: str, message) -> None:
         """Add message to agent's conversation history."""
-        if agent_id not in self.conversation_histories:
-            self.conversation_histories[agent_id] = []
-        self.conversation_histories[agent_id].append(message)
+        history = self.conversation_histories.get(agent_id)
+        if history is None:
+            # Keep history manageable (last 20 messages); the oldest are dropped on append
+            history = self.conversation_histories[agent_id] = deque(maxlen=20)
+        history.append(message)
+
+    def _native_system_message(self, agent: RoutedAgent) -> Optional[SystemMessage]:
+        """Get the SystemMessage for an agent's own system_prompt, building it once per agent."""
+        native = getattr(agent, 'system_prompt', None)
+        if isinstance(native, SystemMessage):
+            content = native.content
+        elif isinstance(native, str):
+            content = native
+        else:
+            return None
+        if not content:
+            return None
+        
+        try:
+            cached = self._system_message_cache.get(agent)
+        except TypeError:  # Agent cannot be weakly referenced
+            cached = None
+        if cached is not None and cached.content == content:
+            return cached
         
-        # Keep history manageable (last 20 messages)
-        if len(self.conversation_histories[agent_id]) > 20:
-            self.conversation_histories[agent_id] = self.conversation_histories[agent_id][-20:]
+        system_msg = SystemMessage(content=content, source="system")
+        try:
+            self._system_message_cache[agent] = system_msg
+        except TypeError:
+            pass
+        return system_msg
 
     async def ask_agent(self, agent: RoutedAgent, prompt: str, 
                        system_prompt: Optional[str] = None, 
@@ -52,49 +229,39 @@ class EnhancedAgentCommunicator:
         Enhanced agent interaction with conversation history and better message handling.
         """
         agent_id = self._get_agent_id(agent)
-        cost = 0.0
-        
-        # Build message list with AutoGen v0.4 standards
-        messages = []
         
-        # Add system prompt
-        system_content = system_prompt
-        if not system_content and hasattr(agent, 'system_prompt'):
-            if isinstance(agent.system_prompt, SystemMessage):
-                system_content = agent.system_prompt.content
-            elif isinstance(agent.system_prompt, str):
-                system_content = agent.system_prompt
-                
-        if system_content:
-            system_msg = SystemMessage(content=system_content, source="system")
-            messages.append(system_msg)
-        
-        # Add conversation history if requested
-        if include_history and agent_id in self.conversation_histories:
-            messages.extend(self.conversation_histories[agent_id])
+        # System prompt; an explicit one overrides the agent's own
+        if system_prompt:
+            system_msg = SystemMessage(content=system_prompt, source="system")
+        else:
+            system_msg = self._native_system_message(agent)
         
-        # Prepare user message with JSON formatting if needed
+        # Prepare user prompt with JSON formatting if needed
         final_prompt = prompt
-        if response_format_json and "json" not in prompt.lower():
+        if response_format_json and not _mentions_json(prompt):
             final_prompt += "\n\nYour response MUST be a valid JSON object. Do not include any other text before or after the JSON object."
         
+        # Build message list with AutoGen v0.4 standards: system, history if requested, then user
         user_msg = UserMessage(content=final_prompt, source="user")
-        messages.append(user_msg)
+        history = self.conversation_histories.get(agent_id, ()) if include_history else ()
+        messages = [system_msg, *history, user_msg] if system_msg else [*history, user_msg]
         
         try:
-            logger.debug(f"Enhanced communication with {agent_id}: '{final_prompt[:150]}...'")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Enhanced communication with %s: '%s...'", agent_id, final_prompt[:150])
             
-            # AutoGen v0.4 standardized call
-            response = await agent._client.create(messages)
+            # AutoGen v0.4 standardized call, waiting for a free slot when the cap is reached
+            slots = self._llm_call_slots()
+            if slots is None:
+                response = await agent._client.create(messages)
+            else:
+                async with slots:
+                    response = await agent._client.create(messages)
             
             if not response or not response.content:
                 raise AgentCommunicationError(f"Empty response from agent {agent_id}")
             
-            # Extract cost using AutoGen v0.4 standards
-            if hasattr(response, 'usage') and response.usage:
-                usage = response.usage
-                # Calculate cost if available (implementation dependent)
-                cost = getattr(usage, 'total_cost', 0.0)
+            cost = _extract_cost(response)
             
             # Add to conversation history
             if include_history:
@@ -103,7 +270,7 @@ class EnhancedAgentCommunicator:
                 assistant_msg = UserMessage(content=response.content, source="assistant")
                 self._add_to_history(agent_id, assistant_msg)
             
-            logger.debug(f"Enhanced communication successful with {agent_id}, cost: {cost}")
+            logger.debug("Enhanced communication successful with %s, cost: %s", agent_id, cost)
             return response.content.strip(), cost
             
         except Exception as e:
@@ -111,18 +278,16 @@ class EnhancedAgentCommunicator:
             raise AgentCommunicationError(f"Failed to communicate with agent {agent_id}: {str(e)}")
 
     def extract_json_from_string(self, text: str) -> Optional[str]:
-        """Extracts the first valid JSON object from a string, looking for ```json ... ``` or raw object."""
+        """Extracts the first complete JSON object or array from a string, preferring a ```json ... ``` block."""
         # First try to find JSON in code blocks: ```json ... ```
-        json_block_match = re.search(r'```json\s*(\{[\s\S]*?\}|\[[\s\S]*?\])\s*```', text, re.DOTALL)
-        if json_block_match:
-            return json_block_match.group(1)
+        fence = text.find(_JSON_FENCE)
+        if fence != -1:
+            json_string = _scan_json_span(text, fence + len(_JSON_FENCE))
+            if json_string:
+                return json_string
         
         # Then try to find raw JSON objects or arrays
-        raw_json_match = re.search(r'(\{[\s\S]*?\}|\[[\s\S]*?\])', text, re.DOTALL)
-        if raw_json_match:
-            return raw_json_match.group(1)
-        
-        return None
+        return _scan_json_span(text)
 
     async def get_json_response(self, 
                                 agent: RoutedAgent, 
@@ -136,69 +301,98 @@ class EnhancedAgentCommunicator:
         Returns the parsed JSON and accumulated cost.
         """
         agent_name = getattr(agent, 'name', 'UnnamedAgent')
-        raw_response = ""
         accumulated_cost = 0.0
         
-        parsing_attempt_log = {
-            "timestamp": datetime.now().isoformat(),
-            "agent_name": agent_name,
-            "prompt": prompt, # Log the prompt that led to this attempt
-            "retry_attempt_number": retry_count + 1,
-            "raw_response": None,
-            "extracted_json_string": None,
-            "parsed_json": None,
-            "error": None,
-            "cost_of_this_attempt": 0.0
-        }
+        while True:
+            raw_response = ""
+            truncated = False
+            parsing_attempt_log = {
+                "timestamp": datetime.now().isoformat(),
+                "agent_name": agent_name,
+                "prompt": self._log_text(prompt), # Log the prompt that led to this attempt
+                "prompt_sha": hashlib.blake2b(prompt.encode(), digest_size=8).hexdigest(),
+                "prompt_len": len(prompt),
+                "retry_attempt_number": retry_count + 1,
+                "raw_response": None,
+                "raw_response_len": None,
+                "extracted_json_string": None,
+                "parsed_json": None,
+                "error": None,
+                "cost_of_this_attempt": 0.0
+            }
 
-        try:
-            raw_response, cost_of_call = await self.ask_agent(agent, prompt, response_format_json=True)
-            accumulated_cost += cost_of_call
-            parsing_attempt_log["raw_response"] = raw_response
-            parsing_attempt_log["cost_of_this_attempt"] = cost_of_call
-            
-            json_string = self.extract_json_from_string(raw_response)
-            parsing_attempt_log["extracted_json_string"] = json_string
-            
-            if not json_string:
-                logger.warning(f"No JSON block found in response from {agent_name}. Raw: '{raw_response[:200]}...'")
-                raise json.JSONDecodeError("No JSON object found in response", raw_response, 0)
-            
-            parsed_json = json.loads(json_string)
-            parsing_attempt_log["parsed_json"] = parsed_json
-            json_parsing_log_list.append(parsing_attempt_log)
-            return parsed_json, accumulated_cost
+            try:
+                raw_response, cost_of_call = await self.ask_agent(agent, prompt, response_format_json=True)
+                accumulated_cost += cost_of_call
+                parsing_attempt_log["raw_response"] = self._log_text(raw_response)
+                parsing_attempt_log["raw_response_len"] = len(raw_response)
+                parsing_attempt_log["cost_of_this_attempt"] = cost_of_call
+                
+                # Well-formed replies are located and parsed in one pass by the C decoder
+                decoded = _decode_json_reply(raw_response)
+                if decoded:
+                    json_string, parsed_json = decoded
+                    parsing_attempt_log["extracted_json_string"] = self._log_text(json_string)
+                else:
+                    json_string = self.extract_json_from_string(raw_response)
+                    parsing_attempt_log["extracted_json_string"] = json_string and self._log_text(json_string)
+                    
+                    if not json_string:
+                        # An opening bracket with no balanced close means the reply was cut short
+                        truncated = _find_json_start(raw_response) != -1
+                        logger.warning(f"No JSON block found in response from {agent_name}. Raw: '{raw_response[:200]}...'")
+                        raise json.JSONDecodeError("No JSON object found in response", raw_response, 0)
+                    
+                    parsed_json = _json_loads(json_string)
+                parsing_attempt_log["parsed_json"] = parsed_json
+                json_parsing_log_list.append(parsing_attempt_log)
+                return parsed_json, accumulated_cost
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON response from {agent_name} (attempt {retry_count + 1}): {str(e)}. Raw response: '{raw_response[:200]}...'")
-            parsing_attempt_log["error"] = f"JSONDecodeError: {str(e)}"
-            json_parsing_log_list.append(parsing_attempt_log) # Log failed attempt
+            except json.JSONDecodeError as e:
+                logger.error(f"Invalid JSON response from {agent_name} (attempt {retry_count + 1}): {str(e)}. Raw response: '{raw_response[:200]}...'")
+                parsing_attempt_log["error"] = f"JSONDecodeError: {str(e)}"
+                json_parsing_log_list.append(parsing_attempt_log) # Log failed attempt
+
+                if retry_count >= self.MAX_JSON_RETRIES:
+                    logger.error(f"Max JSON retries reached for {agent_name}. Giving up.")
+                    raise AgentCommunicationError(f"{error_msg}: Invalid JSON response after multiple retries. Last error: {str(e)}")
 
-            if retry_count < self.MAX_JSON_RETRIES:
                 logger.warning(f"Retrying JSON request to {agent_name} (attempt {retry_count + 2}/{self.MAX_JSON_RETRIES + 1})")
-                retry_prompt = (
-                    f"{prompt}\n\n" # Keep original prompt for context
-                    f"Your previous response was not valid JSON. Please ensure your entire response is a single, valid JSON object (starting with {{ and ending with }} or starting with [ and ending with ]) without any surrounding text or explanations. "
-                    f"The error was: {str(e)}. The raw response started with: '{raw_response[:100]}...'"
-                )
-                await asyncio.sleep(1.5) # Small delay before retry
-                # Recursively call and add cost
-                parsed_json_result, cost_from_retry = await self.get_json_response(agent, retry_prompt, error_msg, json_parsing_log_list, retry_count + 1)
-                accumulated_cost += cost_from_retry
-                return parsed_json_result, accumulated_cost
-            else:
-                logger.error(f"Max JSON retries reached for {agent_name}. Giving up.")
-                raise AgentCommunicationError(f"{error_msg}: Invalid JSON response after multiple retries. Last error: {str(e)}")
-        except AgentCommunicationError as e: # Catch specific error from ask_agent
-            logger.error(f"Agent communication error while expecting JSON from {agent_name}: {str(e)}")
-            parsing_attempt_log["error"] = f"AgentCommunicationError: {str(e)}"
-            json_parsing_log_list.append(parsing_attempt_log)
-            raise
-        except Exception as e: # Catch any other unexpected errors
-            logger.error(f"Unexpected error getting JSON response from {agent_name}: {str(e)}")
-            parsing_attempt_log["error"] = f"UnexpectedError: {str(e)}"
-            json_parsing_log_list.append(parsing_attempt_log)
-            raise AgentCommunicationError(f"{error_msg}: Unexpected error: {str(e)}")
+                # Keep original prompt for context
+                if truncated:
+                    prompt += _TRUNCATED_RETRY
+                else:
+                    prompt = "".join((prompt, _RETRY_PREFIX, str(e), _RETRY_MID, raw_response[:100], _RETRY_SUFFIX))
+                retry_count += 1
+                await asyncio.sleep(_retry_delay(retry_count))
+            except AgentCommunicationError as e: # Catch specific error from ask_agent
+                logger.error(f"Agent communication error while expecting JSON from {agent_name}: {str(e)}")
+                parsing_attempt_log["error"] = f"AgentCommunicationError: {str(e)}"
+                json_parsing_log_list.append(parsing_attempt_log)
+                raise
+            except Exception as e: # Catch any other unexpected errors
+                logger.error(f"Unexpected error getting JSON response from {agent_name}: {str(e)}")
+                parsing_attempt_log["error"] = f"UnexpectedError: {str(e)}"
+                json_parsing_log_list.append(parsing_attempt_log)
+                raise AgentCommunicationError(f"{error_msg}: Unexpected error: {str(e)}")
+
+# Agents that never act as peer reviewers
+_NON_REVIEWER_AGENTS = frozenset({"OrchestrationAgent", "RetrospectiveAnalyser"})
+
+# Review instructions that never change. They lead the prompt so providers' prefix caching
+# can reuse them across reviewers and batches; only the subject and content follow.
+_REVIEW_POLICY = (
+    "You are peer reviewing another agent's work. "
+    "Focus on validity, potential issues, and alignment with overall mission goals. "
+    "Provide specific, actionable feedback. If there are multiple issues, list them clearly. "
+    "If you approve, explain why. "
+    "Your response MUST be a JSON object with the following keys: "
+    "{{\"approved\": bool, \"feedback\": str (detailed feedback/reasons for approval/disapproval), \"estimated_confidence_if_approved\": float (0.0-1.0, your confidence in the content IF you approved it, otherwise 0.0)}}.\n\n"
+)
+_REVIEW_CONTENT = "\n---BEGIN CONTENT---\n{content}\n---END CONTENT---"
+# Peer review prompts; every reviewer in a batch receives the same formatted text
+_REVIEW_PROMPT_FINAL = _REVIEW_POLICY + "Please critically review this final execution result from agent '{subject}':" + _REVIEW_CONTENT
+_REVIEW_PROMPT_INTERIM = _REVIEW_POLICY + "Please critically review this recommendation from agent '{subject}':" + _REVIEW_CONTENT
 
 class ReviewManager:
     """
@@ -217,18 +411,25 @@ class ReviewManager:
                                 available_agents: Dict[str, RoutedAgent],
                                 review_interaction_logs: List[dict], # Log list for detailed review interactions
                                 json_parsing_logs: List[dict],     # Log list for JSON parsing attempts by reviewers
-                                final: bool = False
+                                final: bool = False,
+                                stop_on_consensus: bool = False
                                 ) -> Tuple[List[dict], float]: # Returns list of review dicts, total_review_cost
-        """Run batch peer review. Logs interaction details. Returns review dicts and total cost."""
+        """
+        Run batch peer review. Logs interaction details. Returns review dicts and total cost.
+        
+        With stop_on_consensus, outstanding reviews are cancelled as soon as the completed ones
+        decide check_review_consensus either way; only completed reviews are returned. Cancelled
+        reviewers are still logged, with the cost of any attempts they finished.
+        """
         
         all_reviews_from_batch: List[dict] = [] # This will store the structured JSON responses from reviewers
         accumulated_review_cost = 0.0
 
         if not isinstance(content_to_review, str):
-            content_to_review = json.dumps(content_to_review) if isinstance(content_to_review, dict) else str(content_to_review)
+            content_to_review = _json_dumps(content_to_review) if isinstance(content_to_review, dict) else str(content_to_review)
 
         reviewers = [agent for name, agent in available_agents.items() 
-                    if name != subject_agent_name and hasattr(agent, 'name') and name not in ["OrchestrationAgent", "RetrospectiveAnalyser"]]
+                    if name != subject_agent_name and name not in _NON_REVIEWER_AGENTS and hasattr(agent, 'name')]
         
         if not reviewers:
             logger.warning(f"No other suitable agents available to review output from {subject_agent_name}. Skipping peer review.")
@@ -245,93 +446,164 @@ class ReviewManager:
 
         logger.info(f"Starting batch peer review of output from {subject_agent_name} by {len(reviewers)} agents.")
         
-        for agent_instance in reviewers:
-            agent_instance_name = getattr(agent_instance, 'name', 'UnnamedReviewer')
-            
-            review_log_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "reviewer_agent_name": agent_instance_name,
-                "subject_agent_name": subject_agent_name,
-                "content_reviewed_snippet": content_to_review[:200] + "..." if len(content_to_review) > 200 else content_to_review,
-                "is_final_review": final,
-                "prompt": None, # Will be set below
-                "raw_response": None, # Will be from json_parsing_logs if needed
-                "parsed_review_json": None,
-                "cost": 0.0,
-                "error": None
-            }
-
-            try:
-                review_prompt = (
-                    f"Please critically review this {'final execution result ' if final else 'recommendation '}from agent '{subject_agent_name}':"
-                    f"\n---BEGIN CONTENT---\n{content_to_review}\n---END CONTENT---\n\n"
-                    "Focus on validity, potential issues, and alignment with overall mission goals. "
-                    "Provide specific, actionable feedback. If there are multiple issues, list them clearly. "
-                    "If you approve, explain why. "
-                    "Your response MUST be a JSON object with the following keys: "
-                    "{\"approved\": bool, \"feedback\": str (detailed feedback/reasons for approval/disapproval), \"estimated_confidence_if_approved\": float (0.0-1.0, your confidence in the content IF you approved it, otherwise 0.0)}."
-                )
-                review_log_entry["prompt"] = review_prompt
-                
-                # get_json_response handles retries, logs to json_parsing_logs, and returns cost
-                review_json, cost = await self.communicator.get_json_response(
-                    agent_instance, review_prompt,
-                    f"Failed to get peer review from {agent_instance_name}",
-                    json_parsing_logs # Pass the list for detailed JSON logging
+        # The prompt and log snippet are the same for every reviewer, so build them once
+        review_prompt = (_REVIEW_PROMPT_FINAL if final else _REVIEW_PROMPT_INTERIM).format(
+            subject=subject_agent_name, content=content_to_review
+        )
+        content_snippet = content_to_review[:200] + "..." if len(content_to_review) > 200 else content_to_review
+        # Reviewers all start together, so their log entries share the batch start time
+        batch_timestamp = datetime.now().isoformat()
+        
+        # Parsing logs from here on belong to this batch; cancelled reviewers' finished attempts are costed from them
+        batch_log_start = len(json_parsing_logs)
+        
+        # Reviewers are independent LLM calls, so run them concurrently and handle them as they finish
+        tasks = [
+            asyncio.ensure_future(self._review_one(
+                agent_instance, subject_agent_name, review_prompt, content_snippet, json_parsing_logs, final,
+                batch_timestamp
+            ))
+            for agent_instance in reviewers
+        ]
+        pending = set(tasks)
+        approved_count = 0
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    review, _, _ = task.result()
+                    if review.get("approved", False):
+                        approved_count += 1
+                if stop_on_consensus and pending and self._consensus_decided(approved_count, len(tasks) - len(pending), len(tasks)):
+                    logger.info(f"Peer review consensus decided after {len(tasks) - len(pending)}/{len(tasks)} reviews; cancelling the rest.")
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+        
+        # Results keep reviewer order
+        cancelled_count = 0
+        for agent_instance, task in zip(reviewers, tasks):
+            if task.cancelled():
+                # Attempts that finished before the cancel were billed, so their cost still counts
+                cancelled_count += 1
+                agent_instance_name = getattr(agent_instance, 'name', 'UnnamedReviewer')
+                cost = sum(log["cost_of_this_attempt"] for log in json_parsing_logs[batch_log_start:]
+                           if log["agent_name"] == agent_instance_name)
+                review_log_entry = self._new_review_log_entry(
+                    agent_instance_name, subject_agent_name, content_snippet, final, review_prompt, batch_timestamp
                 )
+                review_log_entry["cost"] = cost
+                review_log_entry["error"] = "Cancelled after peer review consensus was decided"
+                review_interaction_logs.append(review_log_entry)
                 accumulated_review_cost += cost
-                review_log_entry["cost"] = cost # Cost for this specific review call
-                review_log_entry["parsed_review_json"] = review_json
-                
-                # Ensure the review dict from agent has 'agent' field for backward compatibility if needed,
-                # though review_log_entry already has reviewer_agent_name.
-                review_json["agent"] = agent_instance_name 
-                
-                # Convert new review format to legacy format for compatibility
-                review_json["valid"] = review_json.get("approved", False)
-                review_json["issues"] = [] if review_json.get("approved", False) else [review_json.get("feedback", "No feedback provided")]
-                
-                all_reviews_from_batch.append(review_json)
-                
-                # Create a summary of issues for logging
-                issues = review_json.get('issues', [])
-                if issues:
-                    # Show first issue as summary, truncate if too long
-                    issue_summary = issues[0] if issues else "No specific issue"
-                    if len(issue_summary) > 80:
-                        issue_summary = issue_summary[:77] + "..."
-                    if len(issues) > 1:
-                        issue_summary += f" (+{len(issues)-1} more)"
-                    logger.info(f"Review from {agent_instance_name}: Valid={review_json.get('valid')}, Issue: {issue_summary}")
-                else:
-                    logger.info(f"Review from {agent_instance_name}: Valid={review_json.get('valid')}, No issues")
-
-            except (AgentCommunicationError, json.JSONDecodeError) as e: # Catch errors from get_json_response
-                logger.warning(f"Error during peer review from {agent_instance_name}: {str(e)}")
-                review_log_entry["error"] = str(e)
-                # Cost accumulated by get_json_response before failure is already part of `cost` if error was during parsing.
-                # If ask_agent failed before parsing, cost might be 0 or partial from retries.
-                # `cost` variable above will hold the cost from the failed get_json_response call.
-                accumulated_review_cost += review_log_entry.get("cost",0.0) # Ensure cost is added if error was after cost was set
-
-                # Append a structured error review
-                error_review = {
-                    "agent": agent_instance_name, 
-                    "approved": False,
-                    "feedback": f"Review generation error: {str(e)}",
-                    "estimated_confidence_if_approved": 0.0,
-                    "valid": False,  # Legacy compatibility
-                    "issues": [f"Review generation error: {str(e)}"],  # Legacy compatibility
-                    "kpi_valid": False, "kpi_issues": [f"Review generation error: {str(e)}"],
-                    "error_detail": str(e)
-                }
-                all_reviews_from_batch.append(error_review)
-                review_log_entry["parsed_review_json"] = error_review # Log the error structure
-            
-            review_interaction_logs.append(review_log_entry) # Log after each review attempt
+                continue
+            review, review_log_entry, cost = task.result()
+            all_reviews_from_batch.append(review)
+            review_interaction_logs.append(review_log_entry)
+            accumulated_review_cost += cost
+        
+        if cancelled_count:
+            logger.info(f"Cancelled {cancelled_count} outstanding peer review(s); the cost of model calls still in flight is not reported.")
             
         return all_reviews_from_batch, accumulated_review_cost
 
+    @staticmethod
+    def _new_review_log_entry(reviewer_agent_name: str, subject_agent_name: str, content_snippet: str,
+                              final: bool, review_prompt: str, timestamp: str) -> dict:
+        """Create a review interaction log entry before the reviewer has answered."""
+        return {
+            "timestamp": timestamp,
+            "reviewer_agent_name": reviewer_agent_name,
+            "subject_agent_name": subject_agent_name,
+            "content_reviewed_snippet": content_snippet,
+            "is_final_review": final,
+            "prompt": review_prompt,
+            "raw_response": None, # Will be from json_parsing_logs if needed
+            "parsed_review_json": None,
+            "cost": 0.0,
+            "error": None
+        }
+
+    async def _review_one(self,
+                          agent_instance: RoutedAgent,
+                          subject_agent_name: str,
+                          review_prompt: str,
+                          content_snippet: str,
+                          json_parsing_logs: List[dict],
+                          final: bool,
+                          timestamp: str
+                          ) -> Tuple[dict, dict, float]: # Returns review dict, review log entry, cost
+        """Get one reviewer's verdict. Review errors become a rejecting review rather than raising."""
+        agent_instance_name = getattr(agent_instance, 'name', 'UnnamedReviewer')
+        
+        review_log_entry = self._new_review_log_entry(
+            agent_instance_name, subject_agent_name, content_snippet, final, review_prompt, timestamp
+        )
+
+        try:
+            # get_json_response handles retries, logs to json_parsing_logs, and returns cost
+            review_json, cost = await self.communicator.get_json_response(
+                agent_instance, review_prompt,
+                f"Failed to get peer review from {agent_instance_name}",
+                json_parsing_logs # Pass the list for detailed JSON logging
+            )
+            review_log_entry["cost"] = cost # Cost for this specific review call
+            review_log_entry["parsed_review_json"] = review_json
+            
+            # Ensure the review dict from agent has 'agent' field for backward compatibility if needed,
+            # though review_log_entry already has reviewer_agent_name.
+            review_json["agent"] = agent_instance_name 
+            
+            # Convert new review format to legacy format for compatibility
+            review_json["valid"] = review_json.get("approved", False)
+            review_json["issues"] = [] if review_json.get("approved", False) else [review_json.get("feedback", "No feedback provided")]
+            
+            # Create a summary of issues for logging
+            issues = review_json.get('issues', [])
+            if issues:
+                # Show first issue as summary, truncate if too long
+                issue_summary = issues[0] if issues else "No specific issue"
+                if len(issue_summary) > 80:
+                    issue_summary = issue_summary[:77] + "..."
+                if len(issues) > 1:
+                    issue_summary += f" (+{len(issues)-1} more)"
+                logger.info(f"Review from {agent_instance_name}: Valid={review_json.get('valid')}, Issue: {issue_summary}")
+            else:
+                logger.info(f"Review from {agent_instance_name}: Valid={review_json.get('valid')}, No issues")
+            
+            return review_json, review_log_entry, cost
+
+        except (AgentCommunicationError, json.JSONDecodeError) as e: # Catch errors from get_json_response
+            logger.warning(f"Error during peer review from {agent_instance_name}: {str(e)}")
+            review_log_entry["error"] = str(e)
+
+            # Append a structured error review
+            error_review = {
+                "agent": agent_instance_name, 
+                "approved": False,
+                "feedback": f"Review generation error: {str(e)}",
+                "estimated_confidence_if_approved": 0.0,
+                "valid": False,  # Legacy compatibility
+                "issues": [f"Review generation error: {str(e)}"],  # Legacy compatibility
+                "kpi_valid": False, "kpi_issues": [f"Review generation error: {str(e)}"],
+                "error_detail": str(e)
+            }
+            review_log_entry["parsed_review_json"] = error_review # Log the error structure
+            # Cost from a failed get_json_response call is not reported back, so this is usually 0.0
+            return error_review, review_log_entry, review_log_entry["cost"]
+
+    @staticmethod
+    def _consensus_decided(approved_count: int, completed: int, total: int) -> bool:
+        """
+        Whether the outstanding reviews can no longer change the check_review_consensus outcome
+        for the completed ones: majority already reached, or unreachable even if all remaining approve.
+        """
+        remaining = total - completed
+        return approved_count > total / 2 or approved_count + remaining <= total / 2
+
     def check_review_consensus(self, reviews: List[dict]) -> bool:
         """
         Check if there's consensus among reviews.
@@ -340,11 +612,18 @@ class ReviewManager:
         if not reviews:
             return False
         
-        approved_count = sum(1 for review in reviews if review.get("approved", False))
+        # Require majority approval; stop as soon as the outcome is certain
         total_reviews = len(reviews)
-        
-        # Require majority approval
-        return approved_count > total_reviews / 2
+        needed = total_reviews // 2 + 1
+        approved_count = 0
+        for seen, review in enumerate(reviews, 1):
+            if review.get("approved", False):
+                approved_count += 1
+                if approved_count >= needed:
+                    return True
+            elif approved_count + total_reviews - seen < needed:
+                return False
+        return False
 
 # Backward compatibility alias
 AgentCommunicator = EnhancedAgentCommunicator
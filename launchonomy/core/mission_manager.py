@@ -1,8 +1,11 @@
 # orchestrator/mission_management.py
 
-import json
 import os
+import time
+import atexit
 import logging
+import weakref
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict, field
@@ -12,6 +15,17 @@ from .workspace_manager import WorkspaceManager, WorkspaceConfig
 
 logger = logging.getLogger(__name__)
 
+# Cycle summaries are journaled to this file in the workspace state directory; the mission log
+# keeps only the most recent CYCLE_SUMMARY_WINDOW of them
+CYCLE_SUMMARIES_FILE = "cycle_summaries.jsonl"
+CYCLE_SUMMARY_WINDOW = 100
+
+def _flush_at_exit(manager_ref: "weakref.ref[MissionManager]"):
+    """Write a mission manager's pending mission log at interpreter exit, if it is still alive."""
+    manager = manager_ref()
+    if manager is not None:
+        manager.flush()
+
 @dataclass
 class MissionLog:
     """Master mission log that tracks all cycles and provides context for resumable missions."""
@@ -37,7 +51,7 @@ class MissionLog:
     key_learnings: List[str] = field(default_factory=list)
     persistent_agents: List[str] = field(default_factory=list)
     
-    # Linking and history
+    # Linking and history (recent cycle summaries; the full history is in cycle_summaries.jsonl)
     cycle_summaries: List[dict] = field(default_factory=list)
     mission_milestones: List[dict] = field(default_factory=list)
     
@@ -103,15 +117,25 @@ class MissionManager:
             All data is stored in mission-specific workspaces using the Mission Workspace System.
     """
     
-    def __init__(self, workspace_base_dir: str = ".launchonomy"):
+    def __init__(self, workspace_base_dir: str = ".launchonomy",
+                 flush_interval_seconds: float = 2.0, flush_every_updates: int = 10):
         self.current_mission_log: Optional[MissionLog] = None
         self.mission_logs: List[CycleLog] = []
         
         # Initialize workspace manager
         self.workspace_manager = WorkspaceManager(workspace_base_dir)
+        
+        # Cycle updates rewrite the whole mission log, so bursts of them are coalesced: a save
+        # happens once the interval has passed or enough updates are pending, and on flush()
+        self.flush_interval_seconds = flush_interval_seconds
+        self.flush_every_updates = flush_every_updates
+        self._pending_updates = 0
+        self._last_flush = float("-inf")
+        atexit.register(_flush_at_exit, weakref.ref(self))
 
     def create_or_load_mission(self, mission_name: str, overall_mission: str, resume_existing: bool = True) -> MissionLog:
         """Create a new mission or load an existing one for resumable missions."""
+        self.flush()
         
         # Generate mission ID with timestamp first for chronological ordering
         import re
@@ -170,8 +194,8 @@ class MissionManager:
             mission_log.workspace_config = None
         
         # Save mission log to workspace
-        self._save_mission_log_to_workspace(mission_log)
         self.current_mission_log = mission_log
+        self._save_mission_log_to_workspace(mission_log)
         return mission_log
 
     def _find_existing_mission(self, mission_name: str, overall_mission: str) -> Optional[MissionLog]:
@@ -201,14 +225,16 @@ class MissionManager:
             mission_log_file = os.path.join(mission_log.workspace_path, "state", "mission_log.json")
             os.makedirs(os.path.dirname(mission_log_file), exist_ok=True)
             
-            with open(mission_log_file, "w") as f:
-                json.dump(asdict(mission_log), f, indent=2)
+            self.workspace_manager._write_json(mission_log_file, asdict(mission_log))
+            if mission_log is self.current_mission_log:
+                self._pending_updates = 0
+                self._last_flush = time.monotonic()
             
-            # Also save as an asset for easy access
-            self.workspace_manager.save_asset(
+            # Also list it as an asset for easy access; the entry points at the state file
+            self.workspace_manager.register_asset(
                 mission_id=mission_log.mission_id,
                 asset_name="mission_log.json",
-                asset_data=asdict(mission_log),
+                file_path=mission_log_file,
                 asset_type="mission_log",
                 category="logs"
             )
@@ -226,14 +252,40 @@ class MissionManager:
         try:
             mission_log_file = os.path.join(workspace.workspace_path, "state", "mission_log.json")
             if os.path.exists(mission_log_file):
-                with open(mission_log_file, 'r') as f:
-                    data = json.load(f)
-                return MissionLog(**data)
+                data = self.workspace_manager._read_json(mission_log_file)
+                mission_log = MissionLog(**data)
+                self._load_recent_cycle_summaries(mission_log)
+                return mission_log
         except Exception as e:
             logger.error(f"Error loading mission log from workspace: {str(e)}")
         
         return None
 
+    def _load_recent_cycle_summaries(self, mission_log: MissionLog):
+        """Refresh a loaded mission log's recent cycle summaries from the journal, which may be ahead of it."""
+        summaries_file = os.path.join(mission_log.workspace_path, "state", CYCLE_SUMMARIES_FILE)
+        if not os.path.exists(summaries_file):
+            return
+        try:
+            mission_log.cycle_summaries = list(deque(self.workspace_manager._iter_jsonl(summaries_file), maxlen=CYCLE_SUMMARY_WINDOW))
+        except ValueError as e:  # A torn last line from an interrupted write
+            logger.warning(f"Error reading cycle summaries for mission {mission_log.mission_id}, using the mission log's copy: {e}")
+
+    def _journal_cycle_summary(self, mission_log: MissionLog, cycle_summary: dict):
+        """Append a cycle summary to the mission's journal, seeding it with any summaries logged before it existed."""
+        if not mission_log.workspace_path:
+            return
+        try:
+            summaries_file = os.path.join(mission_log.workspace_path, "state", CYCLE_SUMMARIES_FILE)
+            os.makedirs(os.path.dirname(summaries_file), exist_ok=True)
+            if os.path.exists(summaries_file):
+                records = [cycle_summary]
+            else:
+                records = [*mission_log.cycle_summaries, cycle_summary]
+            self.workspace_manager._append_jsonl(summaries_file, records)
+        except Exception as e:
+            logger.error(f"Error journaling cycle summary to workspace: {str(e)}")
+
     def update_mission_log(self, cycle_log: CycleLog):
         """Update the current mission log with information from a completed cycle."""
         if not self.current_mission_log:
@@ -264,11 +316,15 @@ class MissionManager:
             "key_outcomes": cycle_log.kpi_outcomes,
             "timestamp": cycle_log.timestamp
         }
-        self.current_mission_log.cycle_summaries.append(cycle_summary)
+        # Appended to the journal in full; the mission log only carries a window of recent ones
+        self._journal_cycle_summary(self.current_mission_log, cycle_summary)
+        cycle_summaries = self.current_mission_log.cycle_summaries
+        cycle_summaries.append(cycle_summary)
+        del cycle_summaries[:-CYCLE_SUMMARY_WINDOW]
         
         # Extract key learnings from successful cycles
         if cycle_log.status == "success" and cycle_log.kpi_outcomes:
-            learning = f"Cycle {len(self.current_mission_log.cycle_summaries)}: {cycle_log.current_decision_focus} - {cycle_log.kpi_outcomes.get('summary', 'Completed successfully')}"
+            learning = f"Cycle {len(self.current_mission_log.cycle_ids)}: {cycle_log.current_decision_focus} - {cycle_log.kpi_outcomes.get('summary', 'Completed successfully')}"
             self.current_mission_log.key_learnings.append(learning)
         
         # Update persistent agents list
@@ -276,8 +332,16 @@ class MissionManager:
             if agent not in self.current_mission_log.persistent_agents:
                 self.current_mission_log.persistent_agents.append(agent)
         
-        # Save updated mission log to workspace
-        self._save_mission_log_to_workspace(self.current_mission_log)
+        # Save updated mission log to workspace, unless a save happened moments ago
+        self._pending_updates += 1
+        if (self._pending_updates >= self.flush_every_updates
+                or time.monotonic() - self._last_flush >= self.flush_interval_seconds):
+            self._save_mission_log_to_workspace(self.current_mission_log)
+
+    def flush(self):
+        """Save the current mission log if cycle updates are waiting to be written."""
+        if self._pending_updates and self.current_mission_log:
+            self._save_mission_log_to_workspace(self.current_mission_log)
 
     def link_cycle_to_previous(self, cycle_log: CycleLog) -> CycleLog:
         """Link a cycle to the previous cycle in the mission for resumable context."""
@@ -324,13 +388,9 @@ class MissionManager:
             )
             
             if os.path.exists(previous_cycle_file):
-                with open(previous_cycle_file, 'r') as f:
-                    cycle_data = json.load(f)
-                
+                cycle_data = self.workspace_manager._read_json(previous_cycle_file)
                 cycle_data["next_cycle_id"] = current_cycle_id
-                
-                with open(previous_cycle_file, 'w') as f:
-                    json.dump(cycle_data, f, indent=2)
+                self.workspace_manager._write_json(previous_cycle_file, cycle_data)
                 
                 logger.debug(f"Updated previous cycle {previous_cycle_id} with next_cycle_id: {current_cycle_id}")
         except Exception as e:
@@ -460,6 +520,8 @@ class MissionManager:
             logger.warning("No active mission workspace to archive")
             return False
         
+        # Pending cycle updates must be on disk before the workspace is zipped
+        self.flush()
         success = self.workspace_manager.archive_workspace(self.current_mission_log.mission_id)
         
         if success and self.current_mission_log:
@@ -482,14 +544,13 @@ class MissionManager:
             os.makedirs(cycles_dir, exist_ok=True)
             
             cycle_file = os.path.join(cycles_dir, f"{cycle_log.mission_id}.json")
-            with open(cycle_file, "w") as f:
-                json.dump(asdict(cycle_log), f, indent=2)
+            self.workspace_manager._write_json(cycle_file, asdict(cycle_log))
             
-            # Also save as an asset
-            self.workspace_manager.save_asset(
+            # Also list it as an asset; the entry points at the cycle file
+            self.workspace_manager.register_asset(
                 mission_id=self.current_mission_log.mission_id,
                 asset_name=f"cycle_{cycle_log.mission_id}.json",
-                asset_data=asdict(cycle_log),
+                file_path=cycle_file,
                 asset_type="cycle_log",
                 category="logs"
             )
@@ -503,6 +564,7 @@ class MissionManager:
 
     def list_all_missions(self) -> List[Dict[str, Any]]:
         """List all missions from workspaces."""
+        self.flush()
         missions = []
         
         try:
@@ -514,8 +576,7 @@ class MissionManager:
                 
                 if os.path.exists(mission_log_file):
                     try:
-                        with open(mission_log_file, 'r') as f:
-                            mission_data = json.load(f)
+                        mission_data = self.workspace_manager._read_json(mission_log_file)
                         
                         mission_info = {
                             "mission_id": mission_data.get("mission_id", workspace.mission_id),
@@ -100,6 +100,10 @@ class OrchestrationAgent(RoutedAgent):
         self.log_callback = callback
         self.agent_manager.log_callback = callback
 
+    def set_agent_event_callback(self, callback):
+        """Set callback for structured agent lifecycle events (e.g. {"event": "agent_created", "name": ...})."""
+        self.agent_manager.agent_event_callback = callback
+
     def _log(self, message: str, msg_type: str = "info"):
         """Log a message using the callback if available."""
         if not isinstance(message, str):
@@ -790,8 +794,10 @@ class OrchestrationAgent(RoutedAgent):
             total_cost += cost
             
             # Get peer reviews
+            # Only the consensus outcome is used, so stop reviewing once it is decided
             reviews, review_cost = await self.review_manager.batch_peer_review(
-                decision_agent.name, recommendation_text, self.agents, review_logs, json_logs
+                decision_agent.name, recommendation_text, self.agents, review_logs, json_logs,
+                stop_on_consensus=True
             )
             total_cost += review_cost
             
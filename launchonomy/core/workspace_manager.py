@@ -8,15 +8,36 @@ and state management.
 
 import os
 import json
+import heapq
 import shutil
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Union
 from pathlib import Path
 from dataclasses import dataclass, asdict, field
 
+# Imported directly rather than via utils.optional_imports, which eagerly
+# imports every optional web/HTTP dependency and would slow CLI startup
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Per-workspace cache of get_workspace_summary() results
+SUMMARY_CACHE_FILE = ".summary_cache.json"
+
+# Per-workspace denormalized asset counts, kept in step with the asset manifest
+ASSET_COUNTS_FILE = "asset_counts.json"
+
+# Rolling aggregate counters for the whole workspace system, kept under the base directory
+STATS_FILE = ".stats.json"
+
 @dataclass
 class WorkspaceConfig:
     """Configuration for a mission workspace."""
@@ -102,11 +123,9 @@ class WorkspaceManager:
                 if item.is_dir() and not item.name.startswith('.'):
                     config_file = item / "workspace_config.json"
                     if config_file.exists():
-                        with open(config_file, 'r') as f:
-                            config_data = json.load(f)
-                            config = WorkspaceConfig(**config_data)
-                            self.workspaces[config.mission_id] = config
-                            logger.debug(f"Loaded workspace: {config.mission_id}")
+                        config = WorkspaceConfig(**self._read_json(config_file))
+                        self.workspaces[config.mission_id] = config
+                        logger.debug(f"Loaded workspace: {config.mission_id}")
         except Exception as e:
             logger.error(f"Error loading existing workspaces: {e}")
     
@@ -195,8 +214,194 @@ class WorkspaceManager:
         config_path = Path(config.workspace_path) / "workspace_config.json"
         config.last_updated = datetime.now().isoformat()
         
-        with open(config_path, 'w') as f:
-            json.dump(asdict(config), f, indent=2)
+        self._write_json(config_path, asdict(config))
+        
+        # Write-through to the aggregate stats
+        self._update_workspace_stats(config)
+    
+    @staticmethod
+    def _read_json(path: Path) -> Any:
+        """Read a JSON file, using orjson when available."""
+        with open(path, 'rb') as f:
+            data = f.read()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(data)
+        return json.loads(data)
+    
+    @staticmethod
+    def _write_json(path: Path, data: Any):
+        """
+        Atomically write a JSON file indented by two spaces, using orjson when available.
+        
+        The payload goes to a temporary sibling file that is then renamed over the
+        target, so concurrent readers never see a partially written file.
+        """
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(data, indent=2).encode('utf-8')
+        
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
+    @staticmethod
+    def _append_jsonl(path: Path, records: Iterable[Any]):
+        """Append records to a JSON Lines file, one compact object per line, using orjson when available."""
+        if ORJSON_AVAILABLE:
+            payload = b"".join(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS) + b"\n" for record in records)
+        else:
+            payload = "".join(json.dumps(record) + "\n" for record in records).encode('utf-8')
+        with open(path, 'ab') as f:
+            f.write(payload)
+    
+    @staticmethod
+    def _iter_jsonl(path: Path) -> Iterator[Any]:
+        """Iterate the records of a JSON Lines file, using orjson when available."""
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+    
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        """Get a file's size in bytes, or 0 if it does not exist."""
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+    
+    @staticmethod
+    def _directory_size(path: Path) -> int:
+        """Get the total size in bytes of the files under a directory (excluding the summary cache)."""
+        total = 0
+        pending = [os.fspath(path)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        # File type comes from the cached dirent; only sizes need a stat
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file() and entry.name != SUMMARY_CACHE_FILE:
+                            total += entry.stat().st_size
+            except OSError:
+                continue
+        return total
+    
+    def _load_stats(self) -> Optional[Dict[str, Any]]:
+        """Load the aggregate stats file, or None if it does not exist or is unreadable."""
+        try:
+            return self._read_json(self.base_dir / STATS_FILE)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_stats(self, stats: Dict[str, Any]):
+        """Atomically persist the aggregate stats file."""
+        try:
+            self._write_json(self.base_dir / STATS_FILE, stats)
+        except OSError as e:
+            logger.warning(f"Could not write workspace stats: {e}")
+    
+    @staticmethod
+    def _apply_stats_record(stats: Dict[str, Any], record: Dict[str, Any], sign: int):
+        """Add (sign=1) or subtract (sign=-1) one workspace's contribution to the aggregates."""
+        stats["total_workspaces"] += sign
+        for counts, key in [(stats["status_counts"], record["status"])] + \
+                           [(stats["tag_counts"], tag) for tag in record["tags"]]:
+            counts[key] = counts.get(key, 0) + sign
+            if counts[key] <= 0:
+                del counts[key]
+    
+    def _update_workspace_stats(self, workspace: WorkspaceConfig):
+        """
+        Fold a workspace's current status and tags into the aggregate stats.
+        
+        The previous contribution of the workspace is subtracted before the new one is
+        added. Nothing is written until the stats file exists; get_workspace_stats()
+        builds it on first use.
+        """
+        stats = self._load_stats()
+        if stats is None:
+            return
+        
+        records = stats.setdefault("workspaces", {})
+        previous = records.get(workspace.mission_id)
+        if previous is not None:
+            self._apply_stats_record(stats, previous, -1)
+        
+        record = {"status": workspace.status, "tags": list(workspace.tags)}
+        self._apply_stats_record(stats, record, 1)
+        records[workspace.mission_id] = record
+        self._write_stats(stats)
+    
+    def _stats_match_workspaces(self, stats: Dict[str, Any]) -> bool:
+        """Whether the stats records cover exactly the loaded workspaces with their current status and tags."""
+        records = stats.get("workspaces", {})
+        if records.keys() != self.workspaces.keys():
+            return False
+        return all(
+            records[mission_id].get("status") == workspace.status
+            and records[mission_id].get("tags") == list(workspace.tags)
+            for mission_id, workspace in self.workspaces.items()
+        )
+    
+    def _total_size_bytes(self) -> int:
+        """Get the combined size of every workspace, walking the workspaces concurrently."""
+        paths = [Path(w.workspace_path) for w in self.workspaces.values()]
+        if not paths:
+            return 0
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+            return sum(executor.map(self._directory_size, paths))
+    
+    def get_workspace_stats(self, rebuild: bool = False) -> Dict[str, Any]:
+        """
+        Get aggregate counters for the workspace system.
+        
+        Status and tag counts come from the stats file, which is rebuilt automatically
+        when it no longer matches the loaded configs, e.g. after workspaces were added,
+        removed or edited outside this manager. Storage size is measured on every call,
+        because mission logs, journals and other files are written to workspaces
+        without going through this manager.
+        
+        Args:
+            rebuild: Recompute the counts from the loaded configs instead of
+                reading the stats file
+            
+        Returns:
+            Dict with ``total_workspaces``, ``status_counts``, ``tag_counts`` and
+            ``total_size_mb``
+        """
+        stats = None if rebuild else self._load_stats()
+        if stats is None or not self._stats_match_workspaces(stats):
+            stats = {
+                "total_workspaces": 0,
+                "status_counts": {},
+                "tag_counts": {},
+                "workspaces": {}
+            }
+            for workspace in self.workspaces.values():
+                record = {"status": workspace.status, "tags": list(workspace.tags)}
+                self._apply_stats_record(stats, record, 1)
+                stats["workspaces"][workspace.mission_id] = record
+            self._write_stats(stats)
+        
+        stats["total_size_mb"] = self._total_size_bytes() / (1024 * 1024)
+        return stats
+    
+    def _touch_workspace_config(self, workspace: WorkspaceConfig):
+        """Bump the config mtime so cached summaries for this workspace are treated as stale."""
+        config_path = Path(workspace.workspace_path) / "workspace_config.json"
+        if config_path.exists():
+            os.utime(config_path)
     
     def _create_asset_manifest(self, config: WorkspaceConfig):
         """Create initial asset manifest for the workspace."""
@@ -207,8 +412,22 @@ class WorkspaceManager:
         )
         
         manifest_path = Path(config.workspace_path) / "asset_manifest.json"
-        with open(manifest_path, 'w') as f:
-            json.dump(asdict(manifest), f, indent=2)
+        self._write_json(manifest_path, asdict(manifest))
+        
+        self._write_asset_counts(Path(config.workspace_path), manifest)
+    
+    def _write_asset_counts(self, workspace_path: Path, manifest: AssetManifest) -> Dict[str, int]:
+        """Atomically write the asset counts derived from a manifest."""
+        counts = {
+            "agents": len(manifest.agents),
+            "tools": len(manifest.tools),
+            "assets": manifest.total_assets
+        }
+        try:
+            self._write_json(workspace_path / ASSET_COUNTS_FILE, counts)
+        except OSError as e:
+            logger.debug(f"Could not write asset counts for {manifest.mission_id}: {e}")
+        return counts
     
     def get_workspace(self, mission_id: str) -> Optional[WorkspaceConfig]:
         """Get workspace configuration for a mission."""
@@ -359,8 +578,7 @@ class WorkspaceManager:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             if isinstance(asset_data, dict):
                 asset_file = asset_dir / f"{timestamp}_{asset_name}.json"
-                with open(asset_file, 'w') as f:
-                    json.dump(asset_data, f, indent=2)
+                self._write_json(asset_file, asset_data)
             elif isinstance(asset_data, bytes):
                 asset_file = asset_dir / f"{timestamp}_{asset_name}"
                 with open(asset_file, 'wb') as f:
@@ -388,6 +606,40 @@ class WorkspaceManager:
             logger.error(f"Error saving asset to workspace: {e}")
             return None
     
+    def register_asset(self, mission_id: str, asset_name: str, file_path: Union[str, Path],
+                       asset_type: str = "file", category: str = "general") -> Optional[str]:
+        """
+        Record a file already written inside the mission workspace as an asset, without copying it.
+        
+        Args:
+            mission_id: Mission identifier
+            asset_name: Name of the asset
+            file_path: Path to the file, inside the workspace
+            asset_type: Type of asset (file, config, data, etc.)
+            category: Asset category (code, data, configs, media)
+            
+        Returns:
+            Path to the asset relative to workspace, or None if failed
+        """
+        workspace = self.get_workspace(mission_id)
+        if not workspace:
+            logger.error(f"Workspace not found for mission: {mission_id}")
+            return None
+        
+        try:
+            relative_path = Path(file_path).resolve().relative_to(Path(workspace.workspace_path).resolve())
+            self._update_asset_manifest(mission_id, "generated_files", asset_name, {
+                "type": asset_type,
+                "category": category,
+                "file_path": str(relative_path),
+                "created_at": datetime.now().isoformat(),
+                "size_bytes": self._file_size(Path(file_path))
+            })
+            return str(relative_path)
+        except Exception as e:
+            logger.error(f"Error registering asset in workspace: {e}")
+            return None
+    
     def get_asset_path(self, mission_id: str, asset_name: str) -> Optional[Path]:
         """Get the full path to an asset in the workspace."""
         workspace = self.get_workspace(mission_id)
@@ -444,6 +696,7 @@ class WorkspaceManager:
                 with open(checkpoint_file, 'w') as f:
                     json.dump(state_data, f, indent=2)
             
+            self._touch_workspace_config(workspace)
             logger.info(f"Saved mission state for {mission_id}")
             return True
             
@@ -534,21 +787,23 @@ class WorkspaceManager:
             logger.error(f"Error archiving workspace: {e}")
             return False
     
-    def list_workspaces(self, status_filter: Optional[str] = None) -> List[WorkspaceConfig]:
+    def list_workspaces(self, status_filter: Optional[str] = None,
+                        tag_filter: Optional[str] = None) -> List[WorkspaceConfig]:
         """
-        List all workspaces, optionally filtered by status.
+        List all workspaces, optionally filtered by status and/or tag.
         
         Args:
             status_filter: Optional status to filter by
+            tag_filter: Optional tag to filter by
             
         Returns:
-            List of workspace configurations
+            List of workspace configurations, newest first
         """
-        workspaces = list(self.workspaces.values())
-        
-        if status_filter:
-            workspaces = [w for w in workspaces if w.status == status_filter]
-        
+        workspaces = [
+            w for w in self.workspaces.values()
+            if (not status_filter or w.status == status_filter)
+            and (not tag_filter or tag_filter in w.tags)
+        ]
         return sorted(workspaces, key=lambda w: w.created_at, reverse=True)
     
     def get_workspace_summary(self, mission_id: str) -> Optional[Dict[str, Any]]:
@@ -561,13 +816,15 @@ class WorkspaceManager:
         if not manifest:
             return None
         
-        workspace_path = Path(workspace.workspace_path)
-        
-        # Calculate directory sizes
-        total_size = sum(f.stat().st_size for f in workspace_path.rglob('*') if f.is_file())
+        # Calculate directory sizes (the summary cache itself is not workspace content)
+        total_size = self._directory_size(Path(workspace.workspace_path))
         
+        return self._build_summary(workspace, manifest, total_size)
+    
+    def _build_summary(self, workspace: WorkspaceConfig, manifest: AssetManifest, total_size: int) -> Dict[str, Any]:
+        """Assemble a workspace summary from its config, manifest and total size in bytes."""
         return {
-            "mission_id": mission_id,
+            "mission_id": workspace.mission_id,
             "mission_name": workspace.mission_name,
             "status": workspace.status,
             "created_at": workspace.created_at,
@@ -583,6 +840,170 @@ class WorkspaceManager:
             "tags": workspace.tags
         }
     
+    def get_workspace_snapshot(self, mission_id: str, recent_logs_limit: int = 5) -> Optional[Dict[str, Any]]:
+        """
+        Get a fully materialized view of a workspace from a single directory walk.
+        
+        Args:
+            mission_id: Mission identifier
+            recent_logs_limit: Number of newest JSON log files to include
+            
+        Returns:
+            Dict with ``config``, ``summary``, ``structure`` (top-level entries with
+            item counts) and ``recent_logs`` (newest first), or None if unknown.
+            ``structure`` is None when the workspace directory is missing and
+            ``recent_logs`` is None when it has no logs directory.
+        """
+        workspace = self.get_workspace(mission_id)
+        if not workspace:
+            return None
+        
+        root = workspace.workspace_path
+        logs_root = os.path.join(root, workspace.logs_dir)
+        total_size = 0
+        log_heap: List[tuple] = []
+        
+        def scan(directory: str, in_logs: bool) -> int:
+            """Walk a directory tree, returning the number of direct entries."""
+            nonlocal total_size
+            count = 0
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    count += 1
+                    if entry.is_dir(follow_symlinks=False):
+                        try:
+                            scan(entry.path, in_logs)
+                        except OSError:
+                            pass
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        if entry.name != SUMMARY_CACHE_FILE:
+                            total_size += stat.st_size
+                        if in_logs and entry.name.endswith(".json") and recent_logs_limit > 0:
+                            # Bounded heap: keep only the newest log files
+                            item = (stat.st_mtime, os.path.relpath(entry.path, logs_root))
+                            if len(log_heap) < recent_logs_limit:
+                                heapq.heappush(log_heap, item)
+                            else:
+                                heapq.heappushpop(log_heap, item)
+            return count
+        
+        structure: Optional[List[Dict[str, Any]]] = None
+        if os.path.isdir(root):
+            structure = []
+            with os.scandir(root) as entries:
+                top_level = sorted(entries, key=lambda e: e.name)
+            
+            for entry in top_level:
+                if entry.is_dir():
+                    item = {"name": entry.name, "is_dir": True, "item_count": None, "error": None}
+                    try:
+                        item["item_count"] = scan(entry.path, entry.path == logs_root)
+                    except PermissionError:
+                        item["error"] = "permission denied"
+                    except OSError:
+                        pass
+                    structure.append(item)
+                else:
+                    if entry.is_file() and entry.name != SUMMARY_CACHE_FILE:
+                        total_size += entry.stat().st_size
+                    structure.append({"name": entry.name, "is_dir": False})
+        
+        manifest = self._load_asset_manifest(mission_id)
+        recent_logs = None
+        if os.path.isdir(logs_root):
+            recent_logs = [{"path": path, "modified": mtime}
+                           for mtime, path in sorted(log_heap, reverse=True)]
+        
+        return {
+            "config": asdict(workspace),
+            "summary": self._build_summary(workspace, manifest, total_size) if manifest else None,
+            "structure": structure,
+            "recent_logs": recent_logs
+        }
+    
+    def get_workspace_summary_cached(self, mission_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a workspace summary, reusing the on-disk summary cache when it is fresh.
+        
+        The cache lives in the workspace as ``.summary_cache.json`` and is valid while
+        it is newer than both the workspace config and the asset manifest, so repeated
+        listings cost a few stat calls instead of a full directory walk.
+        """
+        workspace = self.get_workspace(mission_id)
+        if not workspace:
+            return None
+        
+        workspace_path = Path(workspace.workspace_path)
+        cache_path = workspace_path / SUMMARY_CACHE_FILE
+        try:
+            cache_mtime = cache_path.stat().st_mtime_ns
+            source_mtime = max(
+                (workspace_path / name).stat().st_mtime_ns
+                for name in ("workspace_config.json", "asset_manifest.json")
+                if (workspace_path / name).exists()
+            )
+            if cache_mtime >= source_mtime:
+                return self._read_json(cache_path)
+        except (OSError, ValueError):
+            # Missing or unreadable cache - fall through and rebuild it
+            pass
+        
+        summary = self.get_workspace_summary(mission_id)
+        if summary is not None:
+            try:
+                self._write_json(cache_path, summary)
+            except OSError as e:
+                logger.debug(f"Could not write summary cache for {mission_id}: {e}")
+        return summary
+    
+    def get_workspace_summaries_batch(self, workspaces: List[Union[str, WorkspaceConfig]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get summaries for several workspaces at once.
+        
+        Summaries are filesystem-bound (stat calls and directory walks), so they are
+        gathered concurrently through the on-disk summary cache.
+        
+        Args:
+            workspaces: Mission IDs or already-loaded workspace configurations
+            
+        Returns:
+            Dict mapping mission ID to summary, omitting workspaces without one
+        """
+        mission_ids = [w if isinstance(w, str) else w.mission_id for w in workspaces]
+        if not mission_ids:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(mission_ids))) as executor:
+            summaries = executor.map(self.get_workspace_summary_cached, mission_ids)
+            return {mission_id: summary for mission_id, summary in zip(mission_ids, summaries)
+                    if summary is not None}
+    
+    def get_asset_counts_fast(self, mission_id: str) -> Optional[Dict[str, int]]:
+        """
+        Get agent, tool and total asset counts for a workspace.
+        
+        Reads the small ``asset_counts.json`` kept in step with the asset manifest,
+        rebuilding it from the manifest if it is missing.
+        
+        Returns:
+            Dict with ``agents``, ``tools`` and ``assets`` counts, or None if unknown
+        """
+        workspace = self.get_workspace(mission_id)
+        if not workspace:
+            return None
+        
+        workspace_path = Path(workspace.workspace_path)
+        try:
+            return self._read_json(workspace_path / ASSET_COUNTS_FILE)
+        except (OSError, ValueError):
+            pass
+        
+        manifest = self._load_asset_manifest(mission_id)
+        if not manifest:
+            return None
+        return self._write_asset_counts(workspace_path, manifest)
+    
     def _update_asset_manifest(self, mission_id: str, category: str, asset_name: str, asset_info: Dict[str, Any]):
         """Update the asset manifest with new asset information."""
         manifest = self._load_asset_manifest(mission_id)
@@ -602,8 +1023,9 @@ class WorkspaceManager:
         workspace = self.get_workspace(mission_id)
         if workspace:
             manifest_path = Path(workspace.workspace_path) / "asset_manifest.json"
-            with open(manifest_path, 'w') as f:
-                json.dump(asdict(manifest), f, indent=2)
+            self._write_json(manifest_path, asdict(manifest))
+            
+            self._write_asset_counts(Path(workspace.workspace_path), manifest)
     
     def _load_asset_manifest(self, mission_id: str) -> Optional[AssetManifest]:
         """Load the asset manifest for a workspace."""
@@ -616,9 +1038,7 @@ class WorkspaceManager:
             return None
         
         try:
-            with open(manifest_path, 'r') as f:
-                manifest_data = json.load(f)
-                return AssetManifest(**manifest_data)
+            return AssetManifest(**self._read_json(manifest_path))
         except Exception as e:
             logger.error(f"Error loading asset manifest: {e}")
             return None
@@ -8,9 +8,11 @@ This module provides functions to calculate costs from various sources:
 - Tool executions
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator, Tuple
 import logging
 
+from .optional_imports import numpy as np, NUMPY_AVAILABLE
+
 logger = logging.getLogger(__name__)
 
 # OpenAI pricing (as of 2024) - update as needed
@@ -88,13 +90,16 @@ THIRD_PARTY_COSTS = {
     }
 }
 
-def calculate_token_cost(input_tokens: int, output_tokens: int, model: str = "gpt-4o-mini") -> float:
-    """Calculate cost based on token usage and model."""
+def _get_model_pricing(model: str) -> Dict[str, float]:
+    """Return per-token pricing for a model, falling back to gpt-4o-mini."""
     if model not in OPENAI_PRICING:
         logger.warning(f"Unknown model {model}, using gpt-4o-mini pricing")
         model = "gpt-4o-mini"
-    
-    pricing = OPENAI_PRICING[model]
+    return OPENAI_PRICING[model]
+
+def calculate_token_cost(input_tokens: int, output_tokens: int, model: str = "gpt-4o-mini") -> float:
+    """Calculate cost based on token usage and model."""
+    pricing = _get_model_pricing(model)
     input_cost = input_tokens * pricing["input"]
     output_cost = output_tokens * pricing["output"]
     
@@ -268,37 +273,83 @@ def calculate_csuite_review_cost(review_data: Dict[str, Any]) -> float:
 
 def calculate_cycle_cost(cycle_log: Dict[str, Any]) -> float:
     """Calculate total cost for a complete cycle."""
-    total_cost = 0.0
-    
-    # C-Suite planning cost
-    if "csuite_planning" in cycle_log:
-        total_cost += calculate_csuite_planning_cost(cycle_log["csuite_planning"])
-    
-    # Workflow steps cost
-    if "steps" in cycle_log:
-        for step_name, step_data in cycle_log["steps"].items():
-            if isinstance(step_data, dict):
-                total_cost += calculate_workflow_step_cost(step_data)
-    
-    # C-Suite review cost
-    if "csuite_review" in cycle_log:
-        total_cost += calculate_csuite_review_cost(cycle_log["csuite_review"])
+    # Shares the batched pricing path so single and batch totals cannot drift apart
+    return calculate_cycle_costs([cycle_log])[0]
+
+def _iter_cost_terms(cost_data: Dict[str, Any], include_operations: bool = True) -> Iterator[Tuple[int, int, Optional[str], float]]:
+    """Yield (input_tokens, output_tokens, model, direct_cost) terms for a step or agent entry."""
+    if "token_usage" in cost_data:
+        token_data = cost_data["token_usage"]
+        yield (token_data.get("input_tokens", 0), token_data.get("output_tokens", 0),
+               token_data.get("model", "gpt-4"), 0.0)
+    
+    if "cost" in cost_data:
+        yield (0, 0, None, cost_data["cost"])
+    
+    if include_operations and "operations" in cost_data:
+        for operation in cost_data["operations"]:
+            if isinstance(operation, dict):
+                yield from _iter_cost_terms(operation)
+
+def _iter_cycle_cost_terms(cycle_log: Dict[str, Any]) -> Iterator[Tuple[int, int, Optional[str], float]]:
+    """Yield every cost term of a cycle: C-Suite planning and review entries, workflow steps and direct costs."""
+    for section in ("csuite_planning", "steps", "csuite_review"):
+        for entry in cycle_log.get(section, {}).values():
+            if isinstance(entry, dict):
+                # Only workflow steps nest sub-operations; C-Suite entries are flat
+                yield from _iter_cost_terms(entry, include_operations=(section == "steps"))
     
-    # Add any direct cycle costs
     if "direct_costs" in cycle_log:
-        total_cost += cycle_log["direct_costs"]
-    
-    return total_cost
+        yield (0, 0, None, cycle_log["direct_costs"])
+
+def calculate_cycle_costs(cycle_logs: List[Dict[str, Any]]) -> List[float]:
+    """
+    Calculate the total cost of many cycles in one batch.
+    
+    Cost terms from all cycles are flattened into parallel arrays so the
+    token pricing arithmetic and per-cycle reduction run as a single
+    vectorized pass (numpy when available, plain Python otherwise).
+    Returns one cost per input cycle, in order.
+    """
+    cycle_indices: List[int] = []
+    input_tokens: List[float] = []
+    output_tokens: List[float] = []
+    input_prices: List[float] = []
+    output_prices: List[float] = []
+    direct_costs: List[float] = []
+    
+    for index, cycle_log in enumerate(cycle_logs):
+        if not isinstance(cycle_log, dict):
+            continue
+        for term_input, term_output, model, direct_cost in _iter_cycle_cost_terms(cycle_log):
+            if model is None:
+                pricing_input, pricing_output = 0.0, 0.0
+            else:
+                pricing = _get_model_pricing(model)
+                pricing_input, pricing_output = pricing["input"], pricing["output"]
+            cycle_indices.append(index)
+            input_tokens.append(term_input)
+            output_tokens.append(term_output)
+            input_prices.append(pricing_input)
+            output_prices.append(pricing_output)
+            direct_costs.append(direct_cost)
+    
+    if NUMPY_AVAILABLE:
+        costs = (np.asarray(input_tokens, dtype=np.float64) * np.asarray(input_prices, dtype=np.float64)
+                 + np.asarray(output_tokens, dtype=np.float64) * np.asarray(output_prices, dtype=np.float64)
+                 + np.asarray(direct_costs, dtype=np.float64))
+        totals = np.bincount(np.asarray(cycle_indices, dtype=np.intp), weights=costs, minlength=len(cycle_logs))
+        return totals.tolist()
+    
+    totals = [0.0] * len(cycle_logs)
+    for index, term_input, term_output, price_in, price_out, direct_cost in zip(
+            cycle_indices, input_tokens, output_tokens, input_prices, output_prices, direct_costs):
+        totals[index] += term_input * price_in + term_output * price_out + direct_cost
+    return totals
 
 def calculate_mission_total_cost(execution_log: List[Dict[str, Any]]) -> float:
     """Calculate total cost for an entire mission from execution log."""
-    total_cost = 0.0
-    
-    for cycle_log in execution_log:
-        if isinstance(cycle_log, dict):
-            total_cost += calculate_cycle_cost(cycle_log)
-    
-    return total_cost
+    return float(sum(calculate_cycle_costs(execution_log)))
 
 def estimate_cost_breakdown(cycle_log: Dict[str, Any]) -> Dict[str, float]:
     """Provide detailed cost breakdown for a cycle."""
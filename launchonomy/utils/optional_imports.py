@@ -53,6 +53,15 @@ except ImportError:
     ORJSON_AVAILABLE = False
     logger.info("orjson not available - using standard json module")
 
+# Vectorized numeric processing
+try:
+    import numpy
+    NUMPY_AVAILABLE = True
+except ImportError:
+    numpy = None
+    NUMPY_AVAILABLE = False
+    logger.info("numpy not available - using pure Python cost aggregation")
+
 # Structured logging
 try:
     import structlog
@@ -113,6 +122,7 @@ def check_optional_dependencies() -> dict:
         "aiohttp": AIOHTTP_AVAILABLE,
         "httpx": HTTPX_AVAILABLE,
         "orjson": ORJSON_AVAILABLE,
+        "numpy": NUMPY_AVAILABLE,
         "structlog": STRUCTLOG_AVAILABLE,
         "prometheus_client": PROMETHEUS_AVAILABLE
     }
@@ -135,6 +145,7 @@ def install_command_for_missing() -> str:
         "aiohttp": "aiohttp>=3.9.0",
         "httpx": "httpx>=0.25.0",
         "orjson": "orjson>=3.9.0",
+        "numpy": "numpy>=1.22.0",
         "structlog": "structlog>=23.0.0",
         "prometheus_client": "prometheus-client>=0.19.0"
     }
@@ -0,0 +1,253 @@
+"""
+Tests for the AgentManager and template loading helpers.
+
+These run without an API key: agents are created locally and never call the model.
+"""
+
+import sys
+import asyncio
+import subprocess
+import pytest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from launchonomy.core import agent_manager
+from launchonomy.core.agent_manager import AgentManager, load_template, TemplateError
+
+
+@pytest.fixture(autouse=True)
+def clear_template_cache():
+    """Start every test with an empty template cache."""
+    agent_manager._TEMPLATE_CACHE.clear()
+    yield
+    agent_manager._TEMPLATE_CACHE.clear()
+
+
+class TestTemplateCache:
+    """Test the in-process template cache."""
+
+    def test_repeat_loads_skip_the_filesystem(self, monkeypatch):
+        """A loaded template is served from the cache on later calls."""
+        monkeypatch.chdir(project_root / "launchonomy")
+        first = load_template("orch_primer")
+        monkeypatch.setattr(agent_manager, "open", lambda path: pytest.fail("template re-read"), raising=False)
+        assert load_template("orch_primer") == first
+
+    def test_misses_are_not_cached(self, monkeypatch, tmp_path):
+        """A template added after a failed load is picked up on the next call."""
+        (tmp_path / "templates").mkdir()
+        monkeypatch.chdir(tmp_path)
+        with pytest.raises(TemplateError):
+            load_template("late_template")
+        (tmp_path / "templates" / "late_template.txt").write_text("added later\n")
+        assert load_template("late_template") == "added later"
+
+    def test_cache_keyed_by_resolved_path(self, monkeypatch, tmp_path):
+        """The same template name in another working directory loads that directory's file."""
+        for directory in ("first", "second"):
+            (tmp_path / directory / "templates").mkdir(parents=True)
+            (tmp_path / directory / "templates" / "primer.txt").write_text(f"from {directory}\n")
+            monkeypatch.chdir(tmp_path / directory)
+            assert load_template("primer") == f"from {directory}"
+
+    def test_falls_back_to_package_path(self, monkeypatch, tmp_path):
+        """Outside the package directory templates are read from launchonomy/templates."""
+        (tmp_path / "launchonomy" / "templates").mkdir(parents=True)
+        (tmp_path / "launchonomy" / "templates" / "fallback.txt").write_text("from package\n")
+        monkeypatch.chdir(tmp_path)
+        assert load_template("fallback") == "from package"
+
+
+class TestCSuitePrompts:
+    """Test the precomputed C-Suite system prompts."""
+
+    def test_prompt_substitutes_only_mission_context(self):
+        """Static fields are filled in at import; the mission context is inserted verbatim."""
+        context = "Sell a $20 template pack {with braces}"
+        prompt = agent_manager._C_SUITE_PROMPT_TEMPLATES["CFO-Agent"].substitute(mission_context=context)
+
+        spec = next(spec for spec in agent_manager.C_SUITE_SPECS if spec.name == "CFO-Agent")
+        assert prompt.startswith(f"You are CFO-Agent, the {spec.persona}.")
+        assert f"Mission Context: {context}\n" in prompt
+        assert "Initial budget $500" in prompt
+        assert set(agent_manager._C_SUITE_PROMPT_TEMPLATES) == {spec.name for spec in agent_manager.C_SUITE_SPECS}
+
+
+class TestConstructorIntrospection:
+    """Test the cached constructor parameter lookup used when loading agents."""
+
+    def test_param_names_cached_per_class(self):
+        """Each class is introspected once and exposes its parameter names as a set."""
+        class CoaAgent:
+            def __init__(self, registry=None, coa=None):
+                pass
+
+        agent_manager._ctor_param_names.cache_clear()
+        assert agent_manager._ctor_param_names(CoaAgent) == frozenset({"self", "registry", "coa"})
+        agent_manager._ctor_param_names(CoaAgent)
+        assert agent_manager._ctor_param_names.cache_info().hits == 1
+
+
+class FakeRegistry:
+    """Minimal registry exposing agents that live in this test module."""
+
+    def __init__(self, agents):
+        self._agents = agents
+
+    def list_agent_names(self):
+        return [*self._agents]
+
+    def get_agent_info(self, name):
+        return self._agents[name]
+
+
+class RegistryAgent:
+    def __init__(self, registry=None, orchestrator=None):
+        self.orchestrator = orchestrator
+        self.name = None
+
+
+class TestLoadRegisteredAgents:
+    """Test instantiating registered agents at startup."""
+
+    def test_shared_module_imported_once(self, monkeypatch):
+        """Agents from the same module resolve it once and are all instantiated and named."""
+        info = {"module": __name__, "class": "RegistryAgent"}
+        registry = FakeRegistry({"AgentOne": info, "AgentTwo": info})
+        imported = []
+        import_module = agent_manager.importlib.import_module
+
+        def counting_import(name):
+            imported.append(name)
+            return import_module(name)
+
+        monkeypatch.setattr(agent_manager.importlib, "import_module", counting_import)
+        manager = AgentManager(registry=registry, client=None)
+        manager.load_registered_agents()
+
+        assert imported == [__name__]
+        assert set(manager.agents) == {"AgentOne", "AgentTwo"}
+        assert manager.agents["AgentOne"].orchestrator is manager
+        assert manager.agents["AgentTwo"].name == "AgentTwo"
+
+
+class TestLazyAutogenImport:
+    """Test that autogen is only imported when an agent is created."""
+
+    def test_module_import_does_not_load_autogen(self):
+        """Importing the agent manager alone leaves autogen unloaded."""
+        code = (
+            "import sys; import launchonomy.core.agent_manager; "
+            "sys.exit(1 if 'autogen_core' in sys.modules else 0)"
+        )
+        assert subprocess.run([sys.executable, "-c", code], cwd=project_root).returncode == 0
+
+    def test_create_agent_registers_agent(self):
+        """create_agent imports autogen on demand and registers the new agent."""
+        manager = AgentManager(registry=None, client=None)
+        agent = asyncio.run(manager.create_agent("TestAgent", "a test persona", "a test primer"))
+        assert manager.agents["TestAgent"] is agent
+        assert agent.name == "TestAgent"
+
+        from autogen_core import RoutedAgent
+        assert isinstance(agent, RoutedAgent)
+        assert agent._client is None and agent.log_callback is None
+
+
+
+class TestUniqueAgentNames:
+    """Test collision-free agent naming."""
+
+    def test_suffixes_increment_per_base_name(self):
+        """Colliding names get _1, _2, ... and skip names registered elsewhere."""
+        manager = AgentManager(registry=None, client=None)
+        assert manager._unique_agent_name("Specialist") == "Specialist"
+
+        manager.agents["Specialist"] = object()
+        assert manager._unique_agent_name("Specialist") == "Specialist_1"
+        manager.agents["Specialist_1"] = object()
+        manager.agents["Specialist_2"] = object()  # registered directly, not via the counter
+        assert manager._unique_agent_name("Specialist") == "Specialist_3"
+        assert manager._unique_agent_name("Other") == "Other"
+
+    def test_cleanup_resets_agents_and_counters(self):
+        """cleanup_agents empties the shared agents dict in place and restarts name suffixes."""
+        manager = AgentManager(registry=None, client=None)
+        agents = manager.agents
+        agents["Specialist"] = object()
+        assert manager._unique_agent_name("Specialist") == "Specialist_1"
+
+        asyncio.run(manager.cleanup_agents())
+        assert manager.agents is agents and not agents
+        assert manager._unique_agent_name("Specialist") == "Specialist"
+
+
+class TestCSuiteBootstrap:
+    """Test concurrent C-Suite bootstrapping."""
+
+    def test_bootstrap_creates_all_agents_and_survives_failures(self, monkeypatch):
+        """Every C-Suite agent is created in spec order; one failure does not stop the rest."""
+        manager = AgentManager(registry=None, client=None)
+        create_agent = manager.create_agent
+
+        async def flaky_create_agent(role_name, persona, primer):
+            if role_name == "CTO-Agent":
+                raise RuntimeError("boom")
+            return await create_agent(role_name, persona, primer)
+
+        monkeypatch.setattr(manager, "create_agent", flaky_create_agent)
+        asyncio.run(manager.bootstrap_c_suite("Test mission"))
+
+        expected = [spec.name for spec in agent_manager.C_SUITE_SPECS if spec.name != "CTO-Agent"]
+        assert list(manager.agents) == expected
+        assert manager.c_suite_bootstrapped
+
+
+class TestSpecializedAgents:
+    """Test specialist creation from generated specs."""
+
+    def test_generated_primer_used_without_template(self, monkeypatch):
+        """Specialists without a template get the default primer filled from their spec."""
+        manager = AgentManager(registry=None, client=None)
+        primers = {}
+
+        async def record_create_agent(role_name, persona, primer):
+            primers[role_name] = primer
+            return role_name
+
+        monkeypatch.setattr(manager, "create_agent", record_create_agent)
+        logs = []
+        agent, cost = asyncio.run(manager.create_specialized_agent("Price {the} launch", logs, [], None))
+
+        assert agent == "SpecialistAgent_0" and cost == 0.0
+        assert primers[agent] == agent_manager._DEFAULT_PRIMER.format(
+            role=agent, persona="an AI assistant specialized for Price {the} launch...",
+            expertise="general problem solving"
+        )
+        assert logs[0]["status"] == "success"
+        assert logs[0]["primer_source"] == "generated_from_spec"
+        assert logs[0]["timestamp"] is not None
+
+
+class TestLogging:
+    """Test AgentManager log routing."""
+
+    def test_msg_type_selects_level(self, caplog):
+        """Known message types map to their logger level; unknown ones log at info."""
+        callback_calls = []
+        manager = AgentManager(registry=None, client=None,
+                               log_callback=lambda *args: callback_calls.append(args))
+        with caplog.at_level("DEBUG", logger=agent_manager.__name__):
+            manager._log("careful", "warning")
+            manager._log("details", "debug")
+            manager._log(42, "unknown")
+
+        assert [(r.levelname, r.getMessage()) for r in caplog.records] == [
+            ("WARNING", "AgentManager: careful"),
+            ("DEBUG", "AgentManager: details"),
+            ("INFO", "AgentManager: 42"),
+        ]
+        assert callback_calls[-1] == ("AgentManager", "42", "unknown")
@@ -156,6 +156,51 @@ class TestCostCalculation:
         assert "workflow_execution" in breakdown
         assert "csuite_review" in breakdown
 
+    def test_batch_cycle_cost_calculation(self):
+        """Test batched cycle costs match per-cycle calculation."""
+        from launchonomy.utils.cost_calculator import calculate_cycle_cost, calculate_cycle_costs, calculate_token_cost
+        
+        cycle_logs = [
+            {
+                "csuite_planning": {"CEO": {"token_usage": {"input_tokens": 100, "output_tokens": 50, "model": "gpt-4"}}},
+                "steps": {
+                    "scan": {
+                        "cost": 0.05,
+                        "operations": [{"token_usage": {"input_tokens": 10, "output_tokens": 5, "model": "gpt-4o"}}]
+                    }
+                },
+                "direct_costs": 1.5
+            },
+            {},
+            {"csuite_review": {"CFO": {"cost": 0.02}, "note": "not a dict"}}
+        ]
+        
+        costs = calculate_cycle_costs(cycle_logs)
+        assert len(costs) == len(cycle_logs)
+        for cost, cycle_log in zip(costs, cycle_logs):
+            assert cost == pytest.approx(calculate_cycle_cost(cycle_log))
+        
+        # Each cost term priced on its own
+        expected_first = (calculate_token_cost(100, 50, "gpt-4") + 0.05
+                          + calculate_token_cost(10, 5, "gpt-4o") + 1.5)
+        assert costs == pytest.approx([expected_first, 0.0, 0.02])
+
+    def test_execution_log_streamed_into_cycle_summaries(self, tmp_path):
+        """Test the spilled execution log is summarized in batches without reading it into a list."""
+        from launchonomy.cli import append_execution_log, iter_execution_log, summarize_execution_log
+
+        spill_path = str(tmp_path / "execution_log.jsonl")
+        append_execution_log(spill_path, [{"iteration": 1, "cycle_successful": True, "steps": {"scan": {"cost": 0.05}}}])
+        start_offset = os.path.getsize(spill_path)
+        append_execution_log(spill_path, [{"iteration": i, "steps": {"scan": {"cost": 0.01 * i}}} for i in range(2, 7)])
+
+        summaries = summarize_execution_log(iter_execution_log(spill_path, start_offset), batch_size=2)
+        assert not isinstance(summaries, list)
+        summaries = list(summaries)
+        assert [s["cycle_id"] for s in summaries] == [f"csuite_cycle_{i}" for i in range(2, 7)]
+        assert [s["total_cycle_cost"] for s in summaries] == pytest.approx([0.01 * i for i in range(2, 7)])
+        assert {s["status"] for s in summaries} == {"failed"}
+
 class TestRegistryOperations:
     """Test agent registry functionality."""
     
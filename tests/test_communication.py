@@ -0,0 +1,364 @@
+"""
+Tests for agent communication and peer review.
+
+These run without an API key: agents are stand-ins whose model client returns canned replies.
+"""
+
+import sys
+import asyncio
+import functools
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from launchonomy.core.communication import (
+    EnhancedAgentCommunicator, ReviewManager, AgentCommunicationError, ConversationManager, _extract_cost
+)
+from launchonomy.core.orchestrator import OrchestrationAgent
+
+
+class FakeClient:
+    """Model client returning a fixed reply after an optional delay, tracking overlapping calls."""
+
+    def __init__(self, reply, delay=0.0, cost=None):
+        self.reply = reply
+        self.delay = delay
+        self.cost = cost
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, messages):
+        self.calls.append(messages)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        reply = self.reply(messages) if callable(self.reply) else self.reply
+        return SimpleNamespace(content=reply, usage=None, cost=self.cost)
+
+
+def make_agent(name, reply, client=None, delay=0.0):
+    """Create a stand-in agent with its own (or a shared) fake client."""
+    return SimpleNamespace(name=name, _client=client or FakeClient(reply, delay))
+
+
+class PromptedAgent:
+    """Agent stand-in with its own system prompt; weakly referenceable like RoutedAgent."""
+
+    def __init__(self, name, system_prompt, reply):
+        self.name = name
+        self.system_prompt = system_prompt
+        self._client = FakeClient(reply)
+
+
+class TestSystemMessages:
+    """Test system message selection in ask_agent."""
+
+    def test_agent_system_message_reused_until_prompt_changes(self):
+        """The agent's own prompt is wrapped once; explicit prompts override it."""
+        communicator = EnhancedAgentCommunicator()
+        agent = PromptedAgent("A", "Be brief.", "ok")
+
+        async def run():
+            await communicator.ask_agent(agent, "one")
+            await communicator.ask_agent(agent, "two")
+            await communicator.ask_agent(agent, "three", system_prompt="Be verbose.")
+            agent.system_prompt = "Be kind."
+            await communicator.ask_agent(agent, "four")
+
+        asyncio.run(run())
+        system_messages = [messages[0] for messages in agent._client.calls]
+        assert system_messages[0] is system_messages[1]
+        assert [m.content for m in system_messages] == ["Be brief.", "Be brief.", "Be verbose.", "Be kind."]
+
+
+class TestJsonInstruction:
+    """Test the JSON instruction ask_agent appends for JSON requests."""
+
+    def test_appended_only_when_prompt_does_not_mention_json(self):
+        """Prompts mentioning JSON in any case are sent unchanged."""
+        communicator = EnhancedAgentCommunicator()
+        agent = make_agent("A", "{}")
+
+        async def run():
+            for prompt in ["Reply with Json", "Reply in jSoN", "Reply with a dict"]:
+                await communicator.ask_agent(agent, prompt, response_format_json=True)
+
+        asyncio.run(run())
+        sent = [messages[-1].content for messages in agent._client.calls]
+        assert sent[:2] == ["Reply with Json", "Reply in jSoN"]
+        assert sent[2].startswith("Reply with a dict\n\nYour response MUST be a valid JSON object.")
+
+
+class TestCostExtraction:
+    """Test reading call cost from model responses."""
+
+    def test_cost_sources(self):
+        """Cost comes from the response, then its usage object or dict; anything else is free."""
+        assert _extract_cost(SimpleNamespace(cost=0.5, usage=None)) == 0.5
+        assert _extract_cost(SimpleNamespace(usage=SimpleNamespace(total_cost=0.25))) == 0.25
+        assert _extract_cost(SimpleNamespace(usage={"total_cost": 1})) == 1.0
+        assert _extract_cost(SimpleNamespace(usage=SimpleNamespace(prompt_tokens=10))) == 0.0
+        assert _extract_cost(SimpleNamespace(usage=None)) == 0.0
+
+
+class TestConversationHistory:
+    """Test per-agent conversation history."""
+
+    def test_history_keeps_last_twenty_messages(self):
+        """Each exchange adds two messages; only the newest twenty are kept and sent."""
+        communicator = EnhancedAgentCommunicator()
+        agent = make_agent("A", lambda messages: f"re: {messages[-1].content}")
+
+        async def run():
+            for i in range(12):
+                await communicator.ask_agent(agent, f"q{i}", include_history=True)
+
+        asyncio.run(run())
+        history = communicator.conversation_histories["A"]
+        assert len(history) == 20
+        assert history[0].content == "q2" and history[-1].content == "re: q11"
+        assert len(agent._client.calls[-1]) == 21
+        assert ConversationManager.get_history_summary(communicator, agent)["message_count"] == 20
+
+
+class TestJsonResponse:
+    """Test get_json_response retries."""
+
+    @pytest.fixture(autouse=True)
+    def delays(self, monkeypatch):
+        """Record the delays between retries instead of sleeping."""
+        delays = []
+
+        async def no_sleep(delay):
+            delays.append(delay)
+        monkeypatch.setattr(asyncio, "sleep", no_sleep)
+        return delays
+
+    def test_retries_until_valid_json(self):
+        """Invalid replies are retried with feedback and every attempt is logged."""
+        replies = iter(["not json", "still not", '{"ok": true}'])
+        agent = make_agent("A", lambda messages: next(replies))
+        logs = []
+
+        result, cost = asyncio.run(EnhancedAgentCommunicator().get_json_response(agent, "Give JSON", "failed", logs))
+
+        assert result == {"ok": True}
+        assert [log["retry_attempt_number"] for log in logs] == [1, 2, 3]
+        assert [log["error"] is None for log in logs] == [False, False, True]
+        assert "previous response was not valid JSON" in logs[2]["prompt"]
+        assert logs[2]["prompt_len"] > len(logs[1]["prompt"]) and logs[2]["raw_response_len"] == 12
+
+    def test_logs_bounded_unless_verbose(self):
+        """Long prompts and replies are logged as snippets with their length and hash."""
+        reply = '{"text": "' + "x" * 1000 + '"}'
+        prompt = "Give JSON " + "y" * 1000
+
+        for verbose in (False, True):
+            logs = []
+            communicator = EnhancedAgentCommunicator(verbose_logging=verbose)
+            asyncio.run(communicator.get_json_response(make_agent("A", reply), prompt, "failed", logs))
+            entry = logs[0]
+            assert entry["prompt_len"] == len(prompt) and entry["raw_response_len"] == len(reply)
+            assert (entry["prompt"] == prompt) is verbose
+            assert (entry["raw_response"] == reply) is verbose
+            assert len(entry["raw_response"]) <= (len(reply) if verbose else 515)
+        assert logs[0]["parsed_json"] == {"text": "x" * 1000}
+
+    def test_truncated_reply_asks_for_shorter_json(self):
+        """Cut-off replies get brevity feedback instead of the parse error."""
+        replies = iter(['{"feedback": "a long answer that stops', '{"feedback": ["so does',  '{"ok": true}'])
+        agent = make_agent("A", lambda messages: next(replies))
+        logs = []
+
+        result, _ = asyncio.run(EnhancedAgentCommunicator().get_json_response(agent, "Give JSON", "failed", logs))
+
+        assert result == {"ok": True}
+        for log in logs[1:]:
+            assert "cut off before the JSON was complete" in log["prompt"]
+            assert "not valid JSON" not in log["prompt"]
+
+    def test_backoff_grows_with_jitter(self, delays):
+        """Retry delays double per attempt within a +/-50% jitter band."""
+        agent = make_agent("A", "never json")
+
+        with pytest.raises(AgentCommunicationError):
+            asyncio.run(EnhancedAgentCommunicator(max_json_retries=3).get_json_response(agent, "Give JSON", "failed", []))
+        assert len(delays) == 3
+        for retry_number, delay in enumerate(delays, 1):
+            base = 0.5 * 2 ** retry_number
+            assert 0.5 * base <= delay < 1.5 * base
+
+    def test_fenced_reply_parsed_and_logged(self):
+        """The JSON inside a fenced block is parsed and recorded as the extracted string."""
+        agent = make_agent("A", 'Here you go {draft}:\n```json\n{"ok": [1, {"n": "}"}]}\n```')
+        logs = []
+
+        result, _ = asyncio.run(EnhancedAgentCommunicator().get_json_response(agent, "Give JSON", "failed", logs))
+
+        assert result == {"ok": [1, {"n": "}"}]}
+        assert logs[0]["extracted_json_string"] == '{"ok": [1, {"n": "}"}]}'
+
+    def test_gives_up_after_max_retries(self):
+        """Once retries are exhausted an AgentCommunicationError is raised."""
+        agent = make_agent("A", "never json")
+        logs = []
+
+        with pytest.raises(AgentCommunicationError):
+            asyncio.run(EnhancedAgentCommunicator(max_json_retries=1).get_json_response(agent, "Give JSON", "failed", logs))
+        assert len(logs) == 2 and len(agent._client.calls) == 2
+
+
+class TestBatchPeerReview:
+    """Test the reviewer fan-out in ReviewManager.batch_peer_review."""
+
+    def test_reviewers_run_concurrently_in_order(self):
+        """All reviewers are asked at once; reviews and logs keep reviewer order."""
+        client = FakeClient('{"approved": true, "feedback": "ok", "estimated_confidence_if_approved": 0.9}', delay=0.05)
+        agents = {name: make_agent(name, None, client=client) for name in ["Author", "R1", "R2", "R3"]}
+        review_logs, parsing_logs = [], []
+
+        reviews, cost = asyncio.run(ReviewManager(EnhancedAgentCommunicator()).batch_peer_review(
+            "Author", "the plan", agents, review_logs, parsing_logs
+        ))
+
+        assert client.max_in_flight == 3
+        assert [r["agent"] for r in reviews] == ["R1", "R2", "R3"]
+        assert [log["reviewer_agent_name"] for log in review_logs] == ["R1", "R2", "R3"]
+        assert len({log["timestamp"] for log in review_logs}) == 1
+        assert all(r["valid"] and r["issues"] == [] for r in reviews)
+        assert cost == 0.0 and len(parsing_logs) == 3
+        # Every reviewer is sent the same prompt text
+        assert len({messages[-1].content for messages in client.calls}) == 1
+        # Static instructions lead; the subject and content come last
+        prompt = review_logs[0]["prompt"]
+        assert prompt.startswith("You are peer reviewing another agent's work.")
+        assert prompt.endswith("recommendation from agent 'Author':\n---BEGIN CONTENT---\nthe plan\n---END CONTENT---")
+
+    def test_concurrent_calls_capped(self):
+        """Reviewer calls beyond max_concurrent_llm_calls wait for a free slot."""
+        client = FakeClient('{"approved": true, "feedback": "ok"}', delay=0.02)
+        agents = {name: make_agent(name, None, client=client) for name in ["Author", "R1", "R2", "R3", "R4", "R5"]}
+        communicator = EnhancedAgentCommunicator(max_concurrent_llm_calls=2)
+
+        for _ in range(2):  # a fresh event loop gets its own semaphore
+            reviews, _ = asyncio.run(ReviewManager(communicator).batch_peer_review("Author", "plan", agents, [], []))
+            assert len(reviews) == 5
+        assert client.max_in_flight == 2 and len(client.calls) == 10
+
+    def test_reviewer_pool_follows_available_agents(self):
+        """The subject, system agents and agents added later are handled on every call."""
+        approve = '{"approved": true, "feedback": "ok"}'
+        agents = {name: make_agent(name, approve) for name in ["Author", "OrchestrationAgent", "R1"]}
+        manager = ReviewManager(EnhancedAgentCommunicator())
+
+        reviews, _ = asyncio.run(manager.batch_peer_review("Author", "plan", agents, [], []))
+        assert [r["agent"] for r in reviews] == ["R1"]
+
+        agents["R2"] = make_agent("R2", approve)
+        reviews, _ = asyncio.run(manager.batch_peer_review("Author", "plan", agents, [], []))
+        assert [r["agent"] for r in reviews] == ["R1", "R2"]
+
+    def test_failed_reviewer_becomes_rejection(self):
+        """A reviewer that never returns valid JSON yields an error review without failing the batch."""
+        agents = {
+            "R1": make_agent("R1", '{"approved": true, "feedback": "ok"}'),
+            "R2": make_agent("R2", "no json here"),
+        }
+        review_logs = []
+
+        reviews, _ = asyncio.run(ReviewManager(EnhancedAgentCommunicator(max_json_retries=0)).batch_peer_review(
+            "Author", {"plan": 1}, agents, review_logs, []
+        ))
+
+        assert [r["approved"] for r in reviews] == [True, False]
+        assert "error_detail" in reviews[1]
+        assert review_logs[1]["error"] is not None
+
+    def test_stop_on_consensus_cancels_outstanding_reviews(self):
+        """Once a majority approves, slower reviewers are cancelled and left out of the results."""
+        approve = '{"approved": true, "feedback": "ok"}'
+        agents = {
+            "Slow": make_agent("Slow", approve, delay=5),
+            "R1": make_agent("R1", approve),
+            "R2": make_agent("R2", approve),
+        }
+        review_logs = []
+        manager = ReviewManager(EnhancedAgentCommunicator())
+
+        reviews, _ = asyncio.run(asyncio.wait_for(
+            manager.batch_peer_review("Author", "plan", agents, review_logs, [], stop_on_consensus=True), timeout=2
+        ))
+
+        assert [r["agent"] for r in reviews] == ["R1", "R2"]
+        assert [log["error"] is None for log in review_logs] == [False, True, True]
+        assert manager.check_review_consensus(reviews)
+
+    def test_cancelled_reviewer_attempts_are_costed(self):
+        """A reviewer cancelled while retrying still contributes the cost of its finished attempt."""
+        approve = '{"approved": true, "feedback": "ok"}'
+        agents = {
+            "Retrying": SimpleNamespace(name="Retrying", _client=FakeClient("no json here", cost=0.25)),
+            "R1": make_agent("R1", approve),
+            "R2": make_agent("R2", approve),
+        }
+        review_logs = []
+
+        reviews, cost = asyncio.run(ReviewManager(EnhancedAgentCommunicator()).batch_peer_review(
+            "Author", "plan", agents, review_logs, [], stop_on_consensus=True
+        ))
+
+        assert [r["agent"] for r in reviews] == ["R1", "R2"]
+        assert cost == 0.25
+        assert review_logs[0]["reviewer_agent_name"] == "Retrying" and review_logs[0]["cost"] == 0.25
+        assert review_logs[0]["error"].startswith("Cancelled")
+
+    def test_consensus_decided(self):
+        """The outcome is decided once a majority approves or can no longer approve."""
+        assert ReviewManager._consensus_decided(approved_count=3, completed=3, total=5)
+        assert ReviewManager._consensus_decided(approved_count=0, completed=3, total=5)
+        assert not ReviewManager._consensus_decided(approved_count=2, completed=3, total=5)
+        assert ReviewManager._consensus_decided(approved_count=1, completed=3, total=4)
+
+
+class TestJsonExtraction:
+    """Test pulling JSON out of free-form agent replies."""
+
+    def test_fenced_block_preferred_over_raw(self):
+        """A ```json block wins over earlier bare braces; bare JSON is the fallback."""
+        communicator = EnhancedAgentCommunicator()
+        text = 'Note {draft}\n```json\n{"approved": true}\n```'
+        assert communicator.extract_json_from_string(text) == '{"approved": true}'
+        assert communicator.extract_json_from_string('Here: [1, 2]\nthanks') == "[1, 2]"
+        assert communicator.extract_json_from_string("no json") is None
+
+    def test_nested_and_string_brackets(self):
+        """Nested objects come back whole and brackets inside strings do not end the span."""
+        communicator = EnhancedAgentCommunicator()
+        nested = '{"plan": {"steps": [1, {"x": "}"}]}, "note": "a \\" } quote"}'
+        assert communicator.extract_json_from_string(f"Sure:\n```json\n{nested}\n```") == nested
+        assert communicator.extract_json_from_string(f"Result {nested} done") == nested
+        assert communicator.extract_json_from_string('{"unterminated": [1, 2') is None
+
+
+class TestReviewConsensus:
+    """Test the majority rule in check_review_consensus."""
+
+    def test_majority_required(self):
+        """Strictly more than half of the reviews must approve."""
+        manager = ReviewManager(EnhancedAgentCommunicator())
+        yes, no = {"approved": True}, {"approved": False}
+        assert not manager.check_review_consensus([])
+        assert manager.check_review_consensus([yes])
+        assert not manager.check_review_consensus([yes, no])
+        assert manager.check_review_consensus([no, yes, yes])
+        assert not manager.check_review_consensus([no, no, yes, {}])
+        assert manager.check_review_consensus([yes, yes, yes, no, no])
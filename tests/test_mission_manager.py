@@ -0,0 +1,156 @@
+"""
+Tests for the MissionManager.
+
+Covers mission and cycle log persistence in mission workspaces.
+"""
+
+import sys
+import json
+import zipfile
+import pytest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from launchonomy.core import mission_manager as mission_manager_module
+from launchonomy.core.mission_manager import MissionManager, CycleLog, CYCLE_SUMMARIES_FILE
+
+
+@pytest.fixture
+def mission_manager(tmp_path):
+    """Create a MissionManager rooted in a temporary directory."""
+    return MissionManager(str(tmp_path / ".launchonomy"))
+
+
+def make_cycle(cycle_id, status="success", **kwargs):
+    """Create a cycle log for the mission under test."""
+    return CycleLog(
+        mission_id=cycle_id,
+        timestamp="2025-01-01T00:00:00",
+        overall_mission="Do things",
+        current_decision_focus=f"focus {cycle_id}",
+        status=status,
+        **kwargs
+    )
+
+
+class TestPersistence:
+    """Test mission and cycle logs written to the workspace."""
+
+    def test_mission_log_round_trip(self, mission_manager):
+        """A saved mission log loads back unchanged and is listed."""
+        mission = mission_manager.create_or_load_mission("Mission One", "Do things")
+        mission_manager.update_mission_log(make_cycle("c1", total_cycle_cost=1.5, kpi_outcomes={"summary": "done", 1: "one"}))
+        mission_manager.flush()
+
+        loaded = mission_manager._load_mission_log_from_workspace(mission.mission_id)
+        assert loaded.cycle_ids == ["c1"] and loaded.total_mission_cost == 1.5
+        assert loaded.cycle_summaries[0]["key_outcomes"] == {"summary": "done", "1": "one"}
+        assert loaded.key_learnings == ["Cycle 1: focus c1 - done"]
+
+        missions = mission_manager.list_all_missions()
+        assert [(m["mission_id"], m["cycles_completed"]) for m in missions] == [(mission.mission_id, 1)]
+
+    def test_cycle_logs_linked_on_disk(self, mission_manager):
+        """Saving the next cycle records its id in the previous cycle's file."""
+        mission = mission_manager.create_or_load_mission("Mission One", "Do things")
+        first = mission_manager.link_cycle_to_previous(make_cycle("c1"))
+        assert mission_manager.save_cycle_log_to_workspace(first)
+        mission_manager.update_mission_log(first)
+
+        second = mission_manager.link_cycle_to_previous(make_cycle("c2"))
+        assert second.previous_cycle_id == "c1" and second.cycle_sequence_number == 2
+
+        cycle_file = Path(mission.workspace_path) / "logs" / "cycles" / "c1.json"
+        assert json.loads(cycle_file.read_text())["next_cycle_id"] == "c2"
+        assert not list(cycle_file.parent.glob("*.tmp"))
+
+    def test_logs_listed_as_assets_without_copies(self, mission_manager):
+        """Mission and cycle logs are registered in the asset manifest, not duplicated."""
+        mission = mission_manager.create_or_load_mission("Mission One", "Do things")
+        cycle = make_cycle("c1")
+        mission_manager.save_cycle_log_to_workspace(cycle)
+        mission_manager.update_mission_log(cycle)
+
+        workspace_path = Path(mission.workspace_path)
+        workspace_manager = mission_manager.workspace_manager
+        assert workspace_manager.get_asset_path(mission.mission_id, "mission_log.json") == workspace_path / "state" / "mission_log.json"
+        assert workspace_manager.get_asset_path(mission.mission_id, "cycle_c1.json") == workspace_path / "logs" / "cycles" / "c1.json"
+        assert not list((workspace_path / "assets").rglob("*.json"))
+
+
+class TestDeferredSaves:
+    """Test that bursts of cycle updates are coalesced into fewer mission log writes."""
+
+    def test_updates_coalesced_until_flush(self, tmp_path):
+        """Updates soon after a save wait for the update limit or an explicit flush."""
+        mission_manager = MissionManager(str(tmp_path / ".launchonomy"), flush_interval_seconds=3600, flush_every_updates=3)
+        mission = mission_manager.create_or_load_mission("Mission One", "Do things")
+        mission_log_file = Path(mission.workspace_path) / "state" / "mission_log.json"
+
+        def saved_cycles():
+            return json.loads(mission_log_file.read_text())["cycle_ids"]
+
+        mission_manager.update_mission_log(make_cycle("c1"))
+        mission_manager.update_mission_log(make_cycle("c2"))
+        assert saved_cycles() == []
+        mission_manager.update_mission_log(make_cycle("c3"))
+        assert saved_cycles() == ["c1", "c2", "c3"]
+
+        mission_manager.update_mission_log(make_cycle("c4"))
+        assert saved_cycles() == ["c1", "c2", "c3"]
+        mission_manager.flush()
+        assert saved_cycles() == ["c1", "c2", "c3", "c4"]
+
+    def test_archive_includes_pending_updates(self, tmp_path):
+        """Archiving flushes deferred updates before the workspace is zipped."""
+        mission_manager = MissionManager(str(tmp_path / ".launchonomy"), flush_interval_seconds=3600)
+        mission_manager.create_or_load_mission("Mission One", "Do things")
+        mission_manager.update_mission_log(make_cycle("c1"))
+
+        assert mission_manager.archive_mission_workspace()
+        [archive] = (tmp_path / ".launchonomy" / "archives").glob("*.zip")
+        with zipfile.ZipFile(archive) as zf:
+            assert json.loads(zf.read("state/mission_log.json"))["cycle_ids"] == ["c1"]
+
+
+class TestCycleSummaryJournal:
+    """Test the append-only cycle summary journal."""
+
+    def test_journal_keeps_history_log_keeps_window(self, mission_manager, monkeypatch):
+        """Every summary is appended to the journal; the mission log holds the recent ones."""
+        monkeypatch.setattr(mission_manager_module, "CYCLE_SUMMARY_WINDOW", 2)
+        mission = mission_manager.create_or_load_mission("Mission One", "Do things")
+        for cycle_id in ["c1", "c2", "c3"]:
+            mission_manager.update_mission_log(make_cycle(cycle_id, kpi_outcomes={"summary": cycle_id}))
+        mission_manager.flush()
+
+        state_dir = Path(mission.workspace_path) / "state"
+        journal = [json.loads(line) for line in (state_dir / CYCLE_SUMMARIES_FILE).read_text().splitlines()]
+        assert [summary["cycle_id"] for summary in journal] == ["c1", "c2", "c3"]
+        saved = json.loads((state_dir / "mission_log.json").read_text())
+        assert [summary["cycle_id"] for summary in saved["cycle_summaries"]] == ["c2", "c3"]
+        assert saved["key_learnings"][-1] == "Cycle 3: focus c3 - c3"
+
+    def test_resume_reads_recent_summaries_from_journal(self, tmp_path):
+        """A resumed mission picks up summaries journaled after its last mission log save."""
+        base_dir = str(tmp_path / ".launchonomy")
+        first = MissionManager(base_dir, flush_interval_seconds=3600)
+        mission = first.create_or_load_mission("Mission One", "Do things")
+        first.update_mission_log(make_cycle("c1"))
+
+        resumed = MissionManager(base_dir).create_or_load_mission("Mission One", "Do things")
+        assert resumed.mission_id == mission.mission_id
+        assert [summary["cycle_id"] for summary in resumed.cycle_summaries] == ["c1"]
+        first.flush()
+
+    def test_journal_seeded_from_existing_summaries(self, mission_manager):
+        """Summaries logged before the journal existed are written to it first."""
+        mission = mission_manager.create_or_load_mission("Mission One", "Do things")
+        mission.cycle_summaries.append({"cycle_id": "old"})
+        mission_manager.update_mission_log(make_cycle("c1"))
+
+        journal = (Path(mission.workspace_path) / "state" / CYCLE_SUMMARIES_FILE).read_text().splitlines()
+        assert [json.loads(line)["cycle_id"] for line in journal] == ["old", "c1"]
@@ -0,0 +1,266 @@
+"""
+Tests for the Mission Workspace Manager.
+
+Covers workspace creation plus the on-disk caches used by the workspace CLI.
+"""
+
+import os
+import sys
+import json
+import shutil
+import pytest
+from pathlib import Path
+from click.testing import CliRunner
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from launchonomy.cli_workspace import workspace
+from launchonomy.core.workspace_manager import WorkspaceManager, SUMMARY_CACHE_FILE, ASSET_COUNTS_FILE, STATS_FILE
+
+
+@pytest.fixture
+def workspace_manager(tmp_path):
+    """Create a WorkspaceManager rooted in a temporary directory."""
+    return WorkspaceManager(str(tmp_path / ".launchonomy"))
+
+
+class TestAtomicWrites:
+    """Test that workspace metadata is replaced atomically."""
+
+    def test_config_save_leaves_no_temp_files(self, workspace_manager):
+        """Config rewrites go through a temporary file that is renamed into place."""
+        config = workspace_manager.create_workspace("m1", "Mission One", "Do things")
+        config.status = "paused"
+        workspace_manager._save_workspace_config(config)
+
+        workspace_path = Path(config.workspace_path)
+        saved = json.loads((workspace_path / "workspace_config.json").read_text())
+        assert saved["status"] == "paused"
+        assert not list(workspace_path.glob("*.tmp"))
+        assert not list(workspace_manager.base_dir.glob("*.tmp"))
+
+
+class TestSummaryCache:
+    """Test the cached workspace summary."""
+
+    def test_cached_summary_matches_summary(self, workspace_manager):
+        """The first cached call computes and stores the summary."""
+        config = workspace_manager.create_workspace("m1", "Mission One", "Do things", tags=["a"])
+
+        summary = workspace_manager.get_workspace_summary_cached("m1")
+        assert summary == workspace_manager.get_workspace_summary("m1")
+        assert (Path(config.workspace_path) / SUMMARY_CACHE_FILE).exists()
+
+    def test_cache_is_reused_until_manifest_changes(self, workspace_manager):
+        """A fresh cache is served from disk; asset changes invalidate it."""
+        config = workspace_manager.create_workspace("m1", "Mission One", "Do things")
+        workspace_manager.get_workspace_summary_cached("m1")
+
+        cache_path = Path(config.workspace_path) / SUMMARY_CACHE_FILE
+        cached = json.loads(cache_path.read_text())
+        cached["mission_name"] = "from cache"
+        cache_path.write_text(json.dumps(cached))
+        assert workspace_manager.get_workspace_summary_cached("m1")["mission_name"] == "from cache"
+
+        # Make the manifest strictly newer than the cache
+        workspace_manager.save_asset("m1", "notes", "hello")
+        manifest_path = Path(config.workspace_path) / "asset_manifest.json"
+        stat = cache_path.stat()
+        os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        summary = workspace_manager.get_workspace_summary_cached("m1")
+        assert summary["mission_name"] == "Mission One"
+        assert summary["asset_counts"]["generated_files"] == 1
+
+    def test_unknown_workspace(self, workspace_manager):
+        """Unknown mission IDs have no summary."""
+        assert workspace_manager.get_workspace_summary_cached("missing") is None
+
+    def test_batch_accepts_ids_and_configs(self, workspace_manager):
+        """Batch summaries accept mission IDs or loaded configs and skip unknown IDs."""
+        config = workspace_manager.create_workspace("m1", "Mission One", "Do things")
+        workspace_manager.create_workspace("m2", "Mission Two", "Do more")
+
+        summaries = workspace_manager.get_workspace_summaries_batch([config, "m2", "missing"])
+        assert set(summaries) == {"m1", "m2"}
+        assert summaries["m2"] == workspace_manager.get_workspace_summary("m2")
+        assert workspace_manager.get_workspace_summaries_batch([]) == {}
+
+
+class TestWorkspaceSnapshot:
+    """Test the single-walk workspace snapshot."""
+
+    def test_snapshot_matches_summary_and_lists_newest_logs(self, workspace_manager):
+        """The snapshot agrees with get_workspace_summary and keeps only the newest logs."""
+        config = workspace_manager.create_workspace("m1", "Mission One", "Do things")
+        cycles_dir = Path(config.workspace_path) / "logs" / "cycles"
+        for i in range(4):
+            log_file = cycles_dir / f"cycle_{i}.json"
+            log_file.write_text("{}")
+            os.utime(log_file, (1_000_000 + i, 1_000_000 + i))
+
+        snapshot = workspace_manager.get_workspace_snapshot("m1", recent_logs_limit=2)
+        assert snapshot["config"]["mission_id"] == "m1"
+        assert snapshot["summary"] == workspace_manager.get_workspace_summary("m1")
+        assert [log["path"] for log in snapshot["recent_logs"]] == [
+            os.path.join("cycles", "cycle_3.json"), os.path.join("cycles", "cycle_2.json")
+        ]
+
+        structure = {item["name"]: item for item in snapshot["structure"]}
+        assert structure["agents"]["item_count"] == 0
+        assert not structure["workspace_config.json"]["is_dir"]
+        assert workspace_manager.get_workspace_snapshot("missing") is None
+
+
+class TestAssetCounts:
+    """Test the denormalized per-workspace asset counts."""
+
+    def test_counts_follow_manifest_updates(self, workspace_manager):
+        """Adding assets updates the counts file alongside the manifest."""
+        workspace_manager.create_workspace("m1", "Mission One", "Do things")
+        assert workspace_manager.get_asset_counts_fast("m1") == {"agents": 0, "tools": 0, "assets": 0}
+
+        workspace_manager.save_asset("m1", "notes", "hello")
+        assert workspace_manager.get_asset_counts_fast("m1") == {"agents": 0, "tools": 0, "assets": 1}
+
+    def test_counts_rebuilt_from_manifest(self, workspace_manager):
+        """A missing counts file is rebuilt from the asset manifest."""
+        config = workspace_manager.create_workspace("m1", "Mission One", "Do things")
+        workspace_manager.save_asset("m1", "notes", "hello")
+        counts_path = Path(config.workspace_path) / ASSET_COUNTS_FILE
+        counts_path.unlink()
+
+        assert workspace_manager.get_asset_counts_fast("m1")["assets"] == 1
+        assert counts_path.exists()
+        assert workspace_manager.get_asset_counts_fast("missing") is None
+
+
+class TestWorkspaceFilters:
+    """Test tag and status filtering in list_workspaces."""
+
+    def test_tag_filter_tracks_tag_changes(self, workspace_manager):
+        """Tag filters follow config saves."""
+        workspace_manager.create_workspace("m1", "Mission One", "Do things", tags=["a", "b"])
+        workspace_manager.create_workspace("m2", "Mission Two", "Do more", tags=["b"])
+
+        assert [w.mission_id for w in workspace_manager.list_workspaces(tag_filter="a")] == ["m1"]
+        assert {w.mission_id for w in workspace_manager.list_workspaces(tag_filter="b")} == {"m1", "m2"}
+
+        config = workspace_manager.get_workspace("m1")
+        config.tags.remove("b")
+        workspace_manager._save_workspace_config(config)
+
+        assert [w.mission_id for w in workspace_manager.list_workspaces(tag_filter="b")] == ["m2"]
+        assert workspace_manager.list_workspaces(tag_filter="missing") == []
+
+    def test_copied_in_workspace_is_filtered(self, workspace_manager, tmp_path):
+        """A workspace copied in from elsewhere is found by tag and status filters."""
+        workspace_manager.create_workspace("m1", "Mission One", "Do things", tags=["a"])
+        elsewhere = WorkspaceManager(str(tmp_path / "elsewhere"))
+        copied = elsewhere.create_workspace("m2", "Mission Two", "Do more", tags=["a"])
+        shutil.copytree(copied.workspace_path, workspace_manager.base_dir / Path(copied.workspace_path).name)
+
+        reloaded = WorkspaceManager(str(workspace_manager.base_dir))
+        assert {w.mission_id for w in reloaded.list_workspaces(tag_filter="a")} == {"m1", "m2"}
+        assert {w.mission_id for w in reloaded.list_workspaces(status_filter="active")} == {"m1", "m2"}
+
+    def test_status_and_tag_filters_intersect(self, workspace_manager):
+        """Combined filters return only workspaces matching both."""
+        workspace_manager.create_workspace("m1", "Mission One", "Do things", tags=["a"])
+        workspace_manager.create_workspace("m2", "Mission Two", "Do more", tags=["a"])
+        workspace_manager.create_workspace("m3", "Mission Three", "Do less", tags=["b"])
+        workspace_manager.archive_workspace("m2")
+
+        result = workspace_manager.list_workspaces(status_filter="active", tag_filter="a")
+        assert [w.mission_id for w in result] == ["m1"]
+        assert workspace_manager.list_workspaces(status_filter="archived", tag_filter="b") == []
+
+
+class TestWorkspaceStats:
+    """Test the aggregate stats used by workspace status."""
+
+    def test_incremental_stats_match_rebuild(self, workspace_manager):
+        """Creates, archives and asset writes keep the stats equal to a full rebuild."""
+        workspace_manager.create_workspace("m1", "Mission One", "Do things", tags=["a"])
+        stats = workspace_manager.get_workspace_stats()
+        assert stats["total_workspaces"] == 1
+        assert (workspace_manager.base_dir / STATS_FILE).exists()
+
+        workspace_manager.create_workspace("m2", "Mission Two", "Do more", tags=["a", "b"])
+        workspace_manager.archive_workspace("m1")
+        workspace_manager.save_asset("m2", "notes", "x" * 4096)
+
+        stats = workspace_manager.get_workspace_stats()
+        assert stats["total_workspaces"] == 2
+        assert stats["status_counts"] == {"active": 1, "archived": 1}
+        assert stats["tag_counts"] == {"a": 2, "b": 1}
+
+        rebuilt = workspace_manager.get_workspace_stats(rebuild=True)
+        assert stats["status_counts"] == rebuilt["status_counts"]
+        assert stats["tag_counts"] == rebuilt["tag_counts"]
+        assert stats["total_size_mb"] == pytest.approx(rebuilt["total_size_mb"], abs=0.01)
+
+    def test_size_counts_files_written_outside_save_methods(self, workspace_manager):
+        """Registered files and appended journals count towards total storage."""
+        config = workspace_manager.create_workspace("m1", "Mission One", "Do things")
+        before = workspace_manager.get_workspace_stats()["total_size_mb"]
+
+        log_file = Path(config.workspace_path) / "state" / "mission_log.json"
+        log_file.write_bytes(b"x" * 1024 * 1024)
+        workspace_manager.register_asset("m1", "mission_log.json", log_file, category="logs")
+        workspace_manager._append_jsonl(Path(config.workspace_path) / "logs" / "journal.jsonl", [{"x": "y" * 1024 * 1024}])
+
+        stats = workspace_manager.get_workspace_stats()
+        assert stats["total_size_mb"] - before == pytest.approx(2.0, abs=0.01)
+
+    def test_stats_rebuilt_after_outside_changes(self, workspace_manager, tmp_path):
+        """Workspaces removed, copied in or edited outside the manager trigger a rebuild on read."""
+        workspace_manager.create_workspace("m1", "Mission One", "Do things", tags=["a"])
+        gone = workspace_manager.create_workspace("m2", "Mission Two", "Do more", tags=["b"])
+        workspace_manager.get_workspace_stats()
+
+        shutil.rmtree(gone.workspace_path)
+        copied = WorkspaceManager(str(tmp_path / "elsewhere")).create_workspace("m3", "Mission Three", "Do less", tags=["c"])
+        shutil.copytree(copied.workspace_path, workspace_manager.base_dir / Path(copied.workspace_path).name)
+
+        stats = WorkspaceManager(str(workspace_manager.base_dir)).get_workspace_stats()
+        assert stats["total_workspaces"] == 2
+        assert stats["tag_counts"] == {"a": 1, "c": 1}
+
+        config_path = workspace_manager.base_dir / Path(copied.workspace_path).name / "workspace_config.json"
+        config = json.loads(config_path.read_text())
+        config["status"] = "paused"
+        config_path.write_text(json.dumps(config))
+
+        stats = WorkspaceManager(str(workspace_manager.base_dir)).get_workspace_stats()
+        assert stats["status_counts"] == {"active": 1, "paused": 1}
+
+
+class TestWorkspaceCLI:
+    """Smoke-test the workspace CLI commands against a temporary base directory."""
+
+    def test_status_counts_statuses_and_tags(self, workspace_manager):
+        """status reports per-status counts and the most common tags."""
+        workspace_manager.create_workspace("m1", "Mission One", "Do things", tags=["a", "b"])
+        workspace_manager.create_workspace("m2", "Mission Two", "Do more", tags=["b"])
+
+        result = CliRunner().invoke(workspace, ["--base-dir", str(workspace_manager.base_dir), "status"])
+        assert result.exit_code == 0, result.output
+        assert "Total Workspaces: 2" in result.output
+        assert "b: 2 workspaces" in result.output
+        assert "a: 1 workspace" in result.output
+
+    def test_list_respects_limit_and_tag(self, workspace_manager):
+        """list shows at most --limit rows and reports when nothing matches."""
+        for i in range(3):
+            workspace_manager.create_workspace(f"m{i}", f"Mission {i}", "Do things", tags=["a"])
+        base_dir = str(workspace_manager.base_dir)
+
+        result = CliRunner().invoke(workspace, ["--base-dir", base_dir, "list", "--tag", "a", "--limit", "2"])
+        assert result.exit_code == 0, result.output
+        assert "(2 found)" in result.output
+
+        result = CliRunner().invoke(workspace, ["--base-dir", base_dir, "list", "--tag", "missing"])
+        assert "No workspaces found" in result.output